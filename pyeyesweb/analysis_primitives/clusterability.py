@@ -6,11 +6,66 @@ a non-random, clustered structure.
 """
 
 from dataclasses import dataclass
+from typing import List, Optional
 import numpy as np
-from sklearn.neighbors import NearestNeighbors
+from scipy.spatial import cKDTree
 
 from pyeyesweb.data_models.base import DynamicFeature
 from pyeyesweb.data_models.results import FeatureResult
+from pyeyesweb.utils.jit import NUMBA_AVAILABLE, njit, prange
+
+# Up to this many samples the compiled brute-force scan beats building a tree
+_BRUTEFORCE_MAX_SAMPLES = 512
+
+
+@njit(cache=True)
+def _column_bounds(data):
+    """Return the per-column `(mins, maxs)` of a 2D array in a single traversal."""
+    mins = data[0].copy()
+    maxs = data[0].copy()
+    for i in range(1, data.shape[0]):
+        for k in range(data.shape[1]):
+            v = data[i, k]
+            if v < mins[k]:
+                mins[k] = v
+            elif v > maxs[k]:
+                maxs[k] = v
+    return mins, maxs
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _hopkins_bruteforce(data, sample_idx, uniform_sample):
+    """Return the Hopkins sums `(u, w)` with an O(m * N * d) nearest-neighbor scan.
+
+    `u` sums the distance from each sampled data point `data[sample_idx]`
+    to its nearest other data point; `w` sums the distance from each
+    uniform point to its nearest data point.
+    """
+    n_samples, n_features = data.shape
+    n_queries = sample_idx.shape[0]
+    u_dist = np.empty(n_queries)
+    w_dist = np.empty(n_queries)
+    for q in prange(2 * n_queries):
+        is_data = q < n_queries
+        query = data[sample_idx[q]] if is_data else uniform_sample[q - n_queries]
+        min_d = np.inf
+        second_min_d = np.inf
+        for i in range(n_samples):
+            d = 0.0
+            for k in range(n_features):
+                diff = data[i, k] - query[k]
+                d += diff * diff
+            if d < min_d:
+                second_min_d = min_d
+                min_d = d
+            elif d < second_min_d:
+                second_min_d = d
+        if is_data:
+            # The closest match of a data point is itself, at distance 0
+            u_dist[q] = np.sqrt(second_min_d)
+        else:
+            w_dist[q - n_queries] = np.sqrt(min_d)
+    return u_dist.sum(), w_dist.sum()
 
 
 @dataclass(slots=True)
@@ -36,10 +91,11 @@ class Clusterability(DynamicFeature):
 
     $$ H = \frac{W}{U + W} $$
 
-    where $U$ is the sum of distances from data points to their nearest
-    neighbors and $W$ is the sum of distances from random points (drawn
-    from a uniform distribution over the data range) to their nearest
-    neighbors in the data.
+    where $U$ is the sum of distances from $m$ randomly sampled data points
+    to their nearest neighbors and $W$ is the sum of distances from $m$
+    random points (drawn from a uniform distribution over the data range)
+    to their nearest neighbors in the data. Following the standard
+    definition, $m \ll n$: one tenth of the window, with a minimum of 5.
 
     !!! note
         The Hopkins statistic evaluates the clustering tendency of a dataset by
@@ -52,17 +108,29 @@ class Clusterability(DynamicFeature):
     ----------
     n_neighbors : int
         The number of neighbors to consider for the nearest neighbor
-        calculations.
+        calculations. Kept for backward compatibility: the Hopkins statistic
+        only uses the nearest neighbor of each query point.
+    seed : int, optional
+        Seed for the random sampling of data and uniform points, for
+        reproducible results. Defaults to `None` (fresh entropy).
 
     Examples
     --------
     >>> clus = Clusterability(n_neighbors=2)
     """
 
-    def __init__(self, n_neighbors: int) -> None:
+    def __init__(self, n_neighbors: int, seed: Optional[int] = None) -> None:
         super().__init__()
         self.n_neighbors = n_neighbors
 
+        self._rng = np.random.default_rng(seed)
+        # Reused across calls while the query shape stays the same
+        self._uniform_buf = None
+
+        # KD-tree of the last window, reused while the window has not rolled
+        self._cached_key = None
+        self._cached_tree = None
+
     @property
     def n_neighbors(self) -> int:
         """The number of neighbors for the nearest neighbor search."""
@@ -93,21 +161,112 @@ class Clusterability(DynamicFeature):
         if data.shape[0] < 5:
             return ClusterabilityResult(is_valid=False)
 
+        n_samples = data.shape[0]
+        n_queries = min(n_samples, max(5, n_samples // 10))
+
         # Generate uniform random sample within data bounds
-        mins = np.min(data, axis=0)
-        maxs = np.max(data, axis=0)
-        uniform_sample = np.random.uniform(mins, maxs, size=data.shape)
+        if NUMBA_AVAILABLE:
+            # Converted once here and shared with the brute-force kernel
+            data = np.ascontiguousarray(data, dtype=np.float64)
+            mins, maxs = _column_bounds(data)
+        else:
+            mins = np.min(data, axis=0)
+            maxs = np.max(data, axis=0)
 
-        n_neighbors = min(data.shape[0], self.n_neighbors)
-        neighbors = NearestNeighbors(n_neighbors=n_neighbors).fit(data)
+        shape = (n_queries, data.shape[1])
+        if self._uniform_buf is None or self._uniform_buf.shape != shape:
+            self._uniform_buf = np.empty(shape)
+        uniform_sample = self._rng.random(out=self._uniform_buf)
+        uniform_sample *= maxs - mins
+        uniform_sample += mins
+        sample_idx = self._rng.choice(n_samples, size=n_queries, replace=False)
 
-        # Data vs Uniform distances
-        data_distances, _ = neighbors.kneighbors(data)
-        u = np.sum(data_distances[:, 1])  # exclude self-distance (0)
+        if NUMBA_AVAILABLE and n_samples <= _BRUTEFORCE_MAX_SAMPLES:
+            # Typical windows are small enough that a compiled scan is
+            # cheaper than building and querying a KD-tree.
+            u, w = _hopkins_bruteforce(data, sample_idx, uniform_sample)
+        else:
+            key = (data.shape, hash(data.tobytes()))
+            if key != self._cached_key:
+                self._cached_tree = cKDTree(data, leafsize=16, balanced_tree=False, compact_nodes=False)
+                self._cached_key = key
+            tree = self._cached_tree
 
-        uniform_distances, _ = neighbors.kneighbors(uniform_sample)
-        w = np.sum(uniform_distances[:, 0])
+            data_distances, _ = tree.query(data[sample_idx], k=2, workers=-1)
+            uniform_distances, _ = tree.query(uniform_sample, k=1, workers=-1)
+            u = float(data_distances[:, 1].sum())  # exclude self-distance (0)
+            w = float(uniform_distances.sum())
 
         hopkins_stat = w / (u + w + 1e-10)
 
-        return ClusterabilityResult(clusterability=float(hopkins_stat))
+        return ClusterabilityResult(clusterability=hopkins_stat)
+
+    def compute_batch(self, windows: List[np.ndarray]) -> List[ClusterabilityResult]:
+        r"""Compute the Hopkins statistic for several windows with one KD-tree.
+
+        Every window is lifted into its own slab of space by an extra
+        coordinate spaced further apart than any window's diameter, so one
+        tree over all windows never returns a neighbor from another window.
+        This amortizes the tree build and runs all nearest-neighbor queries
+        in one parallel call, which suits offline passes over many windows.
+
+        Parameters
+        ----------
+        windows : list of numpy.ndarray
+            Feature windows of shape `(Time, N_signals, N_dims)`. Window
+            lengths may differ but the number of features must match.
+
+        Returns
+        -------
+        list of ClusterabilityResult
+            One result per window, in the same order. Windows with fewer
+            than 5 samples get `ClusterabilityResult(is_valid=False)`.
+        """
+        blocks = []
+        for window in windows:
+            window = np.asarray(window, dtype=np.float64)
+            data = window.reshape(window.shape[0], -1)
+            if data.shape[0] < 5:
+                blocks.append(None)
+                continue
+
+            n_samples = data.shape[0]
+            n_queries = min(n_samples, max(5, n_samples // 10))
+            mins = np.min(data, axis=0)
+            maxs = np.max(data, axis=0)
+            uniform_sample = self._rng.uniform(mins, maxs, size=(n_queries, data.shape[1]))
+            sample_idx = self._rng.choice(n_samples, size=n_queries, replace=False)
+            blocks.append((data, sample_idx, uniform_sample, np.linalg.norm(maxs - mins)))
+
+        valid = [block for block in blocks if block is not None]
+        if not valid:
+            return [ClusterabilityResult(is_valid=False) for _ in blocks]
+        if len({block[0].shape[1] for block in valid}) > 1:
+            raise ValueError("All windows must have the same number of features.")
+
+        # No within-window distance can exceed the largest bounding-box diagonal
+        spacing = 2.0 * max(block[3] for block in valid) + 1.0
+
+        all_data, data_queries, uniform_queries = [], [], []
+        for slab, (data, sample_idx, uniform_sample, _) in enumerate(valid):
+            lift = slab * spacing
+            lifted = np.column_stack((data, np.full(data.shape[0], lift)))
+            all_data.append(lifted)
+            data_queries.append(lifted[sample_idx])
+            uniform_queries.append(np.column_stack((uniform_sample, np.full(uniform_sample.shape[0], lift))))
+
+        tree = cKDTree(np.vstack(all_data), leafsize=16, balanced_tree=False, compact_nodes=False)
+        data_distances, _ = tree.query(np.vstack(data_queries), k=2, workers=-1)
+        uniform_distances, _ = tree.query(np.vstack(uniform_queries), k=1, workers=-1)
+
+        # Split the per-query distances back into per-window sums
+        starts = np.cumsum([0] + [len(block[1]) for block in valid[:-1]])
+        u = np.add.reduceat(data_distances[:, 1], starts)  # exclude self-distance (0)
+        w = np.add.reduceat(uniform_distances, starts)
+        hopkins_stats = iter((w / (u + w + 1e-10)).tolist())
+
+        return [
+            ClusterabilityResult(is_valid=False) if block is None
+            else ClusterabilityResult(clusterability=next(hopkins_stats))
+            for block in blocks
+        ]
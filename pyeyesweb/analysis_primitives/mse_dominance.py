@@ -1,273 +1,546 @@
-"""Multi-scale entropy analysis module for dominance detection in ensemble performances.
-
-This module implements the multi-scale entropy (MSE) algorithm for analyzing
-dominance and leadership in social creative activities. The method quantifies
-the complexity of movement dynamics across multiple time scales to identify
-leadership patterns in musical ensembles.
-
-The multi-scale entropy algorithm includes:
-1. Coarse-graining procedure for multi-scale signal representation
-2. Sample entropy calculation for irregularity quantification
-3. Complexity index computation across scales
-4. Dominance analysis based on complexity differences
-
-Typical use cases include:
-1. Leadership detection in string quartet performances
-2. Dominance analysis in social creative interactions
-3. Group coordination pattern analysis
-4. Movement complexity characterization
-5. Real-time ensemble performance monitoring
-
-References
-----------
-Glowinski, D., Coletta, P., Volpe, G., Camurri, A., Chiorri, C., & Schenone, A. (2010).
-Multi-scale entropy analysis of dominance in social creative activities.
-In Proceedings of the 18th ACM international conference on Multimedia (pp. 1035-1038).
-
-Costa, M., Goldberger, A. L., & Peng, C.-K. (2005).
-Multiscale entropy analysis of biological signals.
-Physical Review E, 71(2), 021906.
-"""
-
-from typing import Literal
-import numpy as np
-from pyeyesweb.data_models.sliding_window import SlidingWindow
-from pyeyesweb.utils.validators import validate_integer, validate_numeric, validate_string
-
-class MultiScaleEntropyDominance:
-    r"""Real-time multi-scale entropy analyzer for dominance detection.
-
-    Quantifies the complexity of movement dynamics across multiple time scales
-    to identify leadership patterns in musical ensembles.
-
-    !!! info
-        The algorithm includes coarse-graining, sample entropy calculation, and
-        complexity index computation as described in Glowinski et al. (2010).
-
-    Read more in the [User Guide](../../user_guide/theoretical_framework/analysis_primitives/mse_dominance.md).
-
-    Parameters
-    ----------
-    m : int, optional
-        Embedding dimension for sample entropy. Defaults to `2`.
-    r : float, optional
-        Tolerance threshold for template matching. Defaults to `0.15`.
-    max_scale : int, optional
-        Maximum scale factor ($\\tau$) for coarse-graining. Defaults to `6`.
-    min_points : int, optional
-        Minimum number of points required for reliable entropy estimation at
-        any given scale. Defaults to `500`.
-    methods : list of str, optional
-        Analysis components to compute. Choices: `"complexity_index"`,
-        `"dominance_score"`, `"leader_identification"`.
-        Defaults to `["complexity_index"]`.
-
-    References
-    ----------
-    Glowinski et al. (2010). Multi-scale entropy analysis of dominance in
-    social creative activities. ACM Multimedia, 1035-1038.
-    """
-    _ALLOWED_METHODS = ["complexity_index", "dominance_score", "leader_identification"]
-    
-    def __init__(self, 
-                 m=2, 
-                 r=0.15, 
-                 max_scale=6, 
-                 min_points=500, 
-                 methods: list[Literal["complexity_index", "dominance_score", "leader_identification"]] = ["complexity_index"]):
-        
-        self.m = m
-        self.r = r
-        self.max_scale = max_scale
-        self.min_points = min_points
-        self.methods = methods
-
-    @property
-    def m(self) -> int:
-        return self._m
-
-    @m.setter
-    def m(self, value):
-        self._m = validate_integer(value, "m", min_val=1)
-        
-    @property
-    def r(self) -> float:
-        return self._r
-
-    @r.setter
-    def r(self, value):
-        self._r = validate_numeric(value, "r", min_val=0.0001, max_val=0.9999)
-        
-    @property
-    def max_scale(self) -> int:
-        return self._max_scale
-
-    @max_scale.setter
-    def max_scale(self, value):
-        self._max_scale = validate_integer(value, "max_scale", min_val=1)
-        
-    @property
-    def min_points(self) -> int:
-        return self._min_points
-
-    @min_points.setter
-    def min_points(self, value):
-        self._min_points = validate_integer(value, "min_points", min_val=1)
-        
-    @property
-    def methods(self) -> list[str]:
-        return self._methods
-
-    @methods.setter
-    def methods(self, value):
-        self._methods = [validate_string(method, self._ALLOWED_METHODS) for method in value]
-
-    def _coarse_grain(self, data: np.ndarray, scale: int) -> np.ndarray:
-        if data is None or data.size == 0:
-            return np.array([], dtype=float)
-
-        x = np.asarray(data, dtype=float).ravel()
-
-        if scale is None or scale < 1:
-            return np.array([], dtype=float)
-
-        if scale == 1:
-            return x
-
-        N = x.shape[0]
-        if N < scale:
-            return np.array([], dtype=float)
-
-        # Calculate number of complete blocks
-        num_points = N // scale
-
-        # Trim data to complete blocks
-        trimmed = x[:num_points * scale]
-
-        # Reshape and average: each block becomes one point
-        coarse = trimmed.reshape(num_points, scale).mean(axis=1)
-
-        return coarse
-
-    def _sample_entropy(self, data: np.ndarray) -> float:
-        x = np.asarray(data, dtype=float).reshape(-1)
-        N = x.shape[0]
-        m = int(self._m)
-        r = float(self._r)
-
-        if N <= m + 10:
-            return np.nan
-
-        mu = float(np.mean(x))
-        sd = float(np.std(x))
-        if sd < 1e-10:
-            return np.nan
-
-        u = (x - mu) / sd
-
-        templates_m = np.array([u[i:i + m] for i in range(N - m)], dtype=float)
-        templates_m1 = np.array([u[i:i + m + 1] for i in range(N - m - 1)], dtype=float)
-
-        n_m = templates_m.shape[0]
-        n_m1 = templates_m1.shape[0]
-
-        if n_m <= 1 or n_m1 <= 1:
-            return 0.0
-
-        B_matches = 0
-        A_matches = 0
-
-        for i in range(n_m):
-            dist = np.max(np.abs(templates_m[i] - templates_m), axis=1)
-            B_matches += int(np.sum(dist < r) - 1)
-
-        for i in range(n_m1):
-            dist = np.max(np.abs(templates_m1[i] - templates_m1), axis=1)
-            A_matches += int(np.sum(dist < r) - 1)
-
-        if B_matches <= 0 or A_matches <= 0:
-            return 0.0
-
-        B = B_matches / (n_m * (n_m - 1))
-        A = A_matches / (n_m1 * (n_m1 - 1))
-
-        if A <= 0 or B <= 0:
-            return 0.0
-
-        return float(-np.log(A / B))
-
-    def _calculate_complexity_index(self, data: np.ndarray) -> float:
-        sampen_values = []
-
-        for scale in range(1, int(self._max_scale) + 1):
-            coarse = self._coarse_grain(data, scale)
-
-            if coarse.shape[0] < int(self._min_points):
-                break
-
-            sampen = self._sample_entropy(coarse)
-            sampen_values.append(sampen)
-
-        if len(sampen_values) > 1:
-            scales = np.arange(1, len(sampen_values) + 1, dtype=float)
-            return float(np.trapz(np.asarray(sampen_values, dtype=float), x=scales))
-
-        if len(sampen_values) == 1:
-            return float(sampen_values[0])
-
-        return 0.0
-
-    def __call__(self, signals: SlidingWindow) -> dict:
-        """Compute dominance analysis for ensemble performance data.
-
-        Evaluates complexity across multiple scales for each signal in the
-        window and optionally computes dominance scores and identifies leaders.
-
-        Parameters
-        ----------
-        signals : SlidingWindow
-            Sliding window buffer containing movement velocity data.
-
-        Returns
-        -------
-        dict
-            Dictionary containing the requested results (e.g.,
-            `'complexity_index'`, `'dominance_score'`).
-        """
-        if not signals.is_full():
-            return {method: np.nan for method in self._methods}
-
-        data, _ = signals.to_array(as2D=True)
-        n_samples, n_features = data.shape
-
-        if n_samples < int(self._min_points):
-            return {method: np.nan for method in self._methods}
-
-        complexity_indices = []
-        for i in range(n_features):
-            ci = self._calculate_complexity_index(data[:, i])
-            complexity_indices.append(ci)
-
-        result = {}
-
-        for method in self._methods:
-            if method == 'complexity_index':
-                values = np.array(complexity_indices, dtype=float)
-                result['complexity_index'] = float(values[0]) if len(values) == 1 else values.tolist()
-
-            elif method == 'dominance_score':
-                cis = np.array(complexity_indices, dtype=float)
-                if cis.size > 0:
-                    max_ci = float(np.max(cis))
-                    if max_ci > 0:
-                        scores = (1.0 - (cis / max_ci))
-                    else:
-                        scores = np.zeros_like(cis)
-                    result['dominance_score'] = float(scores[0]) if len(scores) == 1 else scores.tolist()
-
-            elif method == 'leader_identification':
-                if complexity_indices:
-                    leader_idx = np.argmin(complexity_indices)
-                    result['leader_complexity'] = (int(leader_idx),float(complexity_indices[leader_idx]))
-
-        return result
\ No newline at end of file
+"""Multi-scale entropy analysis module for dominance detection in ensemble performances.
+
+This module implements the multi-scale entropy (MSE) algorithm for analyzing
+dominance and leadership in social creative activities. The method quantifies
+the complexity of movement dynamics across multiple time scales to identify
+leadership patterns in musical ensembles.
+
+The multi-scale entropy algorithm includes:
+1. Coarse-graining procedure for multi-scale signal representation
+2. Sample entropy calculation for irregularity quantification
+3. Complexity index computation across scales
+4. Dominance analysis based on complexity differences
+
+Typical use cases include:
+1. Leadership detection in string quartet performances
+2. Dominance analysis in social creative interactions
+3. Group coordination pattern analysis
+4. Movement complexity characterization
+5. Real-time ensemble performance monitoring
+
+References
+----------
+Glowinski, D., Coletta, P., Volpe, G., Camurri, A., Chiorri, C., & Schenone, A. (2010).
+Multi-scale entropy analysis of dominance in social creative activities.
+In Proceedings of the 18th ACM international conference on Multimedia (pp. 1035-1038).
+
+Costa, M., Goldberger, A. L., & Peng, C.-K. (2005).
+Multiscale entropy analysis of biological signals.
+Physical Review E, 71(2), 021906.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from pyeyesweb.data_models.sliding_window import SlidingWindow
+from pyeyesweb.utils.jit import NUMBA_AVAILABLE, njit, prange
+from pyeyesweb.utils.validators import (
+    validate_float_dtype,
+    validate_integer,
+    validate_numeric,
+    validate_string,
+)
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _sampen_kernel(u, m, r):
+    """Count SampEn template matches without materializing the templates.
+
+    Returns `(A_matches, B_matches)`: the number of ordered pairs of
+    length-`m + 1` and length-`m` templates within Chebyshev distance `r`,
+    excluding self-matches.
+    """
+    n_m = u.shape[0] - m
+    n_m1 = n_m - 1
+    A_matches = 0
+    B_matches = 0
+    for i in prange(n_m):
+        a_i = 0
+        b_i = 0
+        for j in range(i + 1, n_m):
+            matched = True
+            for k in range(m):
+                if abs(u[i + k] - u[j + k]) >= r:
+                    matched = False
+                    break
+            if matched:
+                b_i += 1
+                if j < n_m1 and abs(u[i + m] - u[j + m]) < r:
+                    a_i += 1
+        A_matches += a_i
+        B_matches += b_i
+    # Each unordered pair was visited once
+    return 2 * A_matches, 2 * B_matches
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _sampen_kernel_m2(u, r):
+    """[_sampen_kernel][pyeyesweb.analysis_primitives.mse_dominance._sampen_kernel]
+    unrolled for the default embedding dimension `m = 2`.
+
+    The inner loop is branchless: matches are accumulated from boolean
+    comparisons rather than skipped with `continue`, so LLVM can vectorize
+    it over several candidate templates `j` at once.
+    """
+    n_m = u.shape[0] - 2
+    n_m1 = n_m - 1
+    A_matches = 0
+    B_matches = 0
+    for i in prange(n_m):
+        a_i = 0
+        b_i = 0
+        u0 = u[i]
+        u1 = u[i + 1]
+        u2 = u[i + 2]
+        for j in range(i + 1, n_m1):
+            match_m = (abs(u0 - u[j]) < r) & (abs(u1 - u[j + 1]) < r)
+            b_i += match_m
+            a_i += match_m & (abs(u2 - u[j + 2]) < r)
+        # The last template only exists with length m
+        if i < n_m1:
+            b_i += (abs(u0 - u[n_m1]) < r) & (abs(u1 - u[n_m1 + 1]) < r)
+        A_matches += a_i
+        B_matches += b_i
+    return 2 * A_matches, 2 * B_matches
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _sampen_kernel_batch(stack, lengths, m, r):
+    """Count SampEn template matches for several series in one parallel pass.
+
+    Row `s` of `stack` holds a standardized series in its first
+    `lengths[s]` entries. The template rows of all series are flattened
+    into a single parallel loop, so the long scale-1 series and the short
+    coarse series share the threads instead of running one after another.
+
+    Returns `(A_matches, B_matches)` arrays with one entry per series, with
+    the same meaning as in
+    [_sampen_kernel][pyeyesweb.analysis_primitives.mse_dominance._sampen_kernel].
+    """
+    n_series = lengths.shape[0]
+    offsets = np.zeros(n_series + 1, dtype=np.int64)
+    for s in range(n_series):
+        offsets[s + 1] = offsets[s] + lengths[s] - m
+    a_rows = np.empty(offsets[n_series], dtype=np.int64)
+    b_rows = np.empty(offsets[n_series], dtype=np.int64)
+    for row in prange(offsets[n_series]):
+        s = np.searchsorted(offsets, row, side="right") - 1
+        i = row - offsets[s]
+        n_m = lengths[s] - m
+        n_m1 = n_m - 1
+        u = stack[s]
+        a_i = 0
+        b_i = 0
+        if m == 2:
+            # Branchless form of the default case, as in _sampen_kernel_m2
+            u0 = u[i]
+            u1 = u[i + 1]
+            u2 = u[i + 2]
+            for j in range(i + 1, n_m1):
+                match_m = (abs(u0 - u[j]) < r) & (abs(u1 - u[j + 1]) < r)
+                b_i += match_m
+                a_i += match_m & (abs(u2 - u[j + 2]) < r)
+            if i < n_m1:
+                b_i += (abs(u0 - u[n_m1]) < r) & (abs(u1 - u[n_m1 + 1]) < r)
+        else:
+            for j in range(i + 1, n_m):
+                matched = True
+                for k in range(m):
+                    if abs(u[i + k] - u[j + k]) >= r:
+                        matched = False
+                        break
+                if matched:
+                    b_i += 1
+                    if j < n_m1 and abs(u[i + m] - u[j + m]) < r:
+                        a_i += 1
+        a_rows[row] = a_i
+        b_rows[row] = b_i
+    A_matches = np.empty(n_series, dtype=np.int64)
+    B_matches = np.empty(n_series, dtype=np.int64)
+    for s in range(n_series):
+        A_matches[s] = 2 * a_rows[offsets[s]:offsets[s + 1]].sum()
+        B_matches[s] = 2 * b_rows[offsets[s]:offsets[s + 1]].sum()
+    return A_matches, B_matches
+
+
+# Template rows per tile in the NumPy SampEn fallback, so that a pair of
+# tiles and their pairwise differences stay cache-resident
+_SAMPEN_TILE = 256
+
+
+def _count_matches_tiled(templates, r, tile=_SAMPEN_TILE):
+    """Count SampEn matches from the length-`m + 1` templates in one pass.
+
+    NumPy fallback for the compiled kernels. `templates` holds the `N - m`
+    windows of length `m + 1`; their first `m` coordinates are the
+    length-`m` templates, so both distances come from the same differences.
+    Distances are evaluated tile by tile, and only tiles on or above the
+    diagonal are visited since the distance is symmetric. Rather than
+    taking the Chebyshev maximum, each coordinate is thresholded on its own
+    and the masks are combined, which only ever holds 2D temporaries.
+
+    Returns `(A_matches, B_matches)`, counted as ordered pairs of distinct
+    templates, where `A` only involves the first `N - m - 1` templates.
+    """
+    n, width = templates.shape
+    n_a = n - 1
+    # One contiguous array per template coordinate
+    columns = [np.ascontiguousarray(templates[:, k]) for k in range(width)]
+    A_matches = 0
+    B_matches = 0
+    for i0 in range(0, n, tile):
+        rows = [column[i0:i0 + tile, None] for column in columns]
+        for j0 in range(i0, n, tile):
+            match_m = np.abs(rows[0] - columns[0][None, j0:j0 + tile]) < r
+            for k in range(1, width - 1):
+                match_m &= np.abs(rows[k] - columns[k][None, j0:j0 + tile]) < r
+            match_m1 = match_m & (np.abs(rows[-1] - columns[-1][None, j0:j0 + tile]) < r)
+            # The last window only exists as a length-m template
+            if i0 + tile >= n:
+                match_m1[n_a - i0:, :] = False
+            if j0 + tile >= n:
+                match_m1[:, n_a - j0:] = False
+            weight = 1 if j0 == i0 else 2
+            B_matches += weight * int(np.count_nonzero(match_m))
+            A_matches += weight * int(np.count_nonzero(match_m1))
+    # Every template matches itself at distance 0
+    return A_matches - n_a, B_matches - n
+
+
+# Number of sample entropy results remembered per analyzer
+_SAMPEN_CACHE_SIZE = 64
+
+
+class MultiScaleEntropyDominance:
+    r"""Real-time multi-scale entropy analyzer for dominance detection.
+
+    Quantifies the complexity of movement dynamics across multiple time scales
+    to identify leadership patterns in musical ensembles.
+
+    !!! info
+        The algorithm includes coarse-graining, sample entropy calculation, and
+        complexity index computation as described in Glowinski et al. (2010).
+
+    Read more in the [User Guide](../../user_guide/theoretical_framework/analysis_primitives/mse_dominance.md).
+
+    Parameters
+    ----------
+    m : int, optional
+        Embedding dimension for sample entropy. Defaults to `2`.
+    r : float, optional
+        Tolerance threshold for template matching. Defaults to `0.15`.
+    max_scale : int, optional
+        Maximum scale factor ($\\tau$) for coarse-graining. Defaults to `6`.
+    min_points : int, optional
+        Minimum number of points required for reliable entropy estimation at
+        any given scale. Defaults to `500`.
+    methods : list of str, optional
+        Analysis components to compute. Choices: `"complexity_index"`,
+        `"dominance_score"`, `"leader_identification"`.
+        Defaults to `["complexity_index"]`.
+    dtype : {numpy.float32, numpy.float64}, optional
+        Precision of the standardized signal used for template matching.
+        Single precision halves the memory streamed by the pairwise distance
+        loop and is ample for thresholded comparisons on standardized
+        signals. Defaults to `numpy.float32`.
+
+    References
+    ----------
+    Glowinski et al. (2010). Multi-scale entropy analysis of dominance in
+    social creative activities. ACM Multimedia, 1035-1038.
+    """
+    _ALLOWED_METHODS = ["complexity_index", "dominance_score", "leader_identification"]
+    
+    def __init__(self, 
+                 m=2, 
+                 r=0.15, 
+                 max_scale=6, 
+                 min_points=500, 
+                 methods: list[Literal["complexity_index", "dominance_score", "leader_identification"]] = ["complexity_index"],
+                 dtype=np.float32):
+        
+        self.m = m
+        self.r = r
+        self.max_scale = max_scale
+        self.min_points = min_points
+        self.methods = methods
+        self.dtype = dtype
+
+        # LRU of SampEn values keyed on the exact input series and the
+        # matching parameters, shared by the per-signal worker threads
+        self._sampen_cache = OrderedDict()
+        self._sampen_cache_lock = threading.Lock()
+
+    @property
+    def m(self) -> int:
+        return self._m
+
+    @m.setter
+    def m(self, value):
+        self._m = validate_integer(value, "m", min_val=1)
+        
+    @property
+    def r(self) -> float:
+        return self._r
+
+    @r.setter
+    def r(self, value):
+        self._r = validate_numeric(value, "r", min_val=0.0001, max_val=0.9999)
+        
+    @property
+    def max_scale(self) -> int:
+        return self._max_scale
+
+    @max_scale.setter
+    def max_scale(self, value):
+        self._max_scale = validate_integer(value, "max_scale", min_val=1)
+        
+    @property
+    def min_points(self) -> int:
+        return self._min_points
+
+    @min_points.setter
+    def min_points(self, value):
+        self._min_points = validate_integer(value, "min_points", min_val=1)
+        
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        self._dtype = validate_float_dtype(value, "dtype")
+
+    @property
+    def methods(self) -> list[str]:
+        return self._methods
+
+    @methods.setter
+    def methods(self, value):
+        self._methods = [validate_string(method, self._ALLOWED_METHODS) for method in value]
+
+    def _sample_entropy(self, data: np.ndarray) -> float:
+        return self._sample_entropies([data])[0]
+
+    def _sample_entropies(self, series: list) -> list:
+        """Return the SampEn of each series, computing cache misses together."""
+        values = [None] * len(series)
+        pending = []
+        with self._sampen_cache_lock:
+            for idx, data in enumerate(series):
+                x = np.asarray(data, dtype=float).reshape(-1)
+                # A window that has not changed since the last call (or a
+                # signal repeated across features) maps to identical bytes.
+                key = (x.tobytes(), self._m, self._r, self._dtype)
+                if key in self._sampen_cache:
+                    self._sampen_cache.move_to_end(key)
+                    values[idx] = self._sampen_cache[key]
+                else:
+                    pending.append((idx, key, x))
+
+        if not pending:
+            return values
+
+        standardized = []
+        for idx, _, x in pending:
+            u = self._standardize(x)
+            if u is None:
+                values[idx] = np.nan
+            else:
+                standardized.append((idx, u))
+
+        if NUMBA_AVAILABLE and len(standardized) > 1:
+            # All coarse-grained series of a signal in one parallel call
+            lengths = np.array([u.shape[0] for _, u in standardized], dtype=np.int64)
+            stack = np.zeros((len(standardized), lengths.max()), dtype=self._dtype)
+            for row, (_, u) in enumerate(standardized):
+                stack[row, :u.shape[0]] = u
+            A_counts, B_counts = _sampen_kernel_batch(stack, lengths, self._m, self._dtype.type(self._r))
+            for row, (idx, u) in enumerate(standardized):
+                values[idx] = self._sampen_from_counts(int(A_counts[row]), int(B_counts[row]), u.shape[0])
+        else:
+            for idx, u in standardized:
+                values[idx] = self._sampen_from_counts(*self._count_matches(u), u.shape[0])
+
+        with self._sampen_cache_lock:
+            for idx, key, _ in pending:
+                self._sampen_cache[key] = values[idx]
+            while len(self._sampen_cache) > _SAMPEN_CACHE_SIZE:
+                self._sampen_cache.popitem(last=False)
+        return values
+
+    def _standardize(self, x: np.ndarray):
+        """Return `x` as z-scores in the matching precision, or `None` if too short or constant."""
+        if x.shape[0] <= self._m + 10:
+            return None
+
+        mu = float(x.sum()) / x.size
+        sd = float(np.std(x))
+        if sd < 1e-10:
+            return None
+
+        return ((x - mu) / sd).astype(self._dtype)
+
+    def _count_matches(self, u: np.ndarray) -> tuple:
+        m = int(self._m)
+        r = self._dtype.type(self._r)
+        if NUMBA_AVAILABLE:
+            if m == 2:
+                return _sampen_kernel_m2(u, r)
+            return _sampen_kernel(u, m, r)
+        # Zero-copy view of the N - m windows of length m + 1
+        return _count_matches_tiled(sliding_window_view(u, m + 1), r)
+
+    def _sampen_from_counts(self, A_matches: int, B_matches: int, N: int) -> float:
+        n_m = N - self._m
+        n_m1 = n_m - 1
+
+        if B_matches <= 0 or A_matches <= 0:
+            return 0.0
+
+        # -log(A / B) with A and B the match counts normalized by their pair
+        # counts, expanded into a sum of logs of the integer counts
+        return (math.log(B_matches) - math.log(A_matches)
+                + math.log(n_m1 * (n_m1 - 1)) - math.log(n_m * (n_m - 1)))
+
+    def _coarse_grained_series(self, data: np.ndarray) -> list:
+        """Return the coarse-grained series of `data` for each scale with enough points."""
+        series = []
+
+        x = np.asarray(data, dtype=float).ravel()
+        N = x.shape[0]
+        # One prefix sum serves every scale: each coarse-grained point is the
+        # difference of two prefix sums, so the signal is read only once.
+        csum = np.concatenate(([0.0], np.cumsum(x)))
+
+        for scale in range(1, int(self._max_scale) + 1):
+            num_points = N // scale
+            if num_points < int(self._min_points):
+                break
+
+            if scale == 1:
+                series.append(x)
+            else:
+                end = num_points * scale
+                series.append((csum[scale:end + 1:scale] - csum[:end:scale]) / scale)
+        return series
+
+    def _calculate_complexity_index(self, data: np.ndarray) -> float:
+        sampen_values = self._sample_entropies(self._coarse_grained_series(data))
+
+        if len(sampen_values) > 1:
+            # Trapezoidal rule over unit-spaced scales; the list holds at
+            # most max_scale values, so plain float arithmetic is cheapest.
+            return float(0.5 * (sampen_values[0] + sampen_values[-1]) + sum(sampen_values[1:-1]))
+
+        if len(sampen_values) == 1:
+            return float(sampen_values[0])
+
+        return 0.0
+
+    def __call__(self, signals: SlidingWindow, out: dict | None = None) -> dict:
+        """Compute dominance analysis for ensemble performance data.
+
+        Evaluates complexity across multiple scales for each signal in the
+        window and optionally computes dominance scores and identifies leaders.
+
+        Parameters
+        ----------
+        signals : SlidingWindow
+            Sliding window buffer containing movement velocity data.
+        out : dict, optional
+            Dictionary to update in place instead of allocating a new one.
+            Per-signal values are then stored as `numpy.ndarray` of shape
+            `(n_signals,)`, and arrays left in `out` by a previous call are
+            refilled rather than reallocated. Suited to real-time loops that
+            forward the arrays as they are.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the requested results (e.g.,
+            `'complexity_index'`, `'dominance_score'`). This is `out` when
+            it is given.
+        """
+        if not signals.is_full:
+            return self._fill_nan(out)
+
+        # Column-major so each signal handed to the entropy kernel is contiguous
+        data, _ = signals.to_flat_array(order="F")
+        n_samples, n_features = data.shape
+
+        if n_samples < int(self._min_points):
+            return self._fill_nan(out)
+
+        complexity_indices = self._out_array(out, 'complexity_index', n_features)
+        if n_features > 1 and not NUMBA_AVAILABLE:
+            # Each signal (e.g. each musician) is independent, and the NumPy
+            # match counting releases the GIL, so the signals are processed
+            # concurrently. The Numba kernels already parallelize internally;
+            # launching them from worker threads would oversubscribe the
+            # cores and can deadlock the threading layer at exit.
+            with ThreadPoolExecutor(max_workers=n_features) as executor:
+                for i, ci in enumerate(executor.map(self._calculate_complexity_index, data.T)):
+                    complexity_indices[i] = ci
+        else:
+            for i in range(n_features):
+                complexity_indices[i] = self._calculate_complexity_index(data[:, i])
+
+        result = {} if out is None else out
+
+        for method in self._methods:
+            if method == 'complexity_index':
+                values = complexity_indices
+                if out is None:
+                    result['complexity_index'] = float(values[0]) if len(values) == 1 else values.tolist()
+                else:
+                    result['complexity_index'] = values
+
+            elif method == 'dominance_score':
+                cis = complexity_indices
+                if cis.size > 0:
+                    scores = self._out_array(out, 'dominance_score', n_features)
+                    max_ci = float(np.max(cis))
+                    if max_ci > 0:
+                        np.divide(cis, max_ci, out=scores)
+                        np.subtract(1.0, scores, out=scores)
+                    else:
+                        scores.fill(0.0)
+                    if out is None:
+                        result['dominance_score'] = float(scores[0]) if len(scores) == 1 else scores.tolist()
+                    else:
+                        result['dominance_score'] = scores
+
+            elif method == 'leader_identification':
+                if complexity_indices.size > 0:
+                    leader_idx = np.argmin(complexity_indices)
+                    result['leader_complexity'] = (int(leader_idx),float(complexity_indices[leader_idx]))
+
+        return result
+
+    @staticmethod
+    def _out_array(out, key, size):
+        """Return a float array of `size` to fill, reusing `out[key]` when possible."""
+        if out is not None:
+            buf = out.get(key)
+            if isinstance(buf, np.ndarray) and buf.shape == (size,) and buf.dtype == np.float64:
+                return buf
+        return np.empty(size)
+
+    def _fill_nan(self, out):
+        """Return the not-ready result, filling `out` in place when given."""
+        if out is None:
+            return {method: np.nan for method in self._methods}
+        for method in self._methods:
+            # Same key as the ready path, so no stale leader survives
+            key = 'leader_complexity' if method == 'leader_identification' else method
+            buf = out.get(key)
+            if isinstance(buf, np.ndarray) and buf.dtype == np.float64:
+                buf.fill(np.nan)
+            else:
+                out[key] = np.nan
+        return out
@@ -10,6 +10,7 @@ import numpy as np
 
 from pyeyesweb.data_models.base import DynamicFeature
 from pyeyesweb.data_models.results import FeatureResult
+from pyeyesweb.data_models.sliding_window import SlidingWindow
 from pyeyesweb.utils.validators import validate_numeric
 
 
@@ -38,6 +39,11 @@ class Rarity(DynamicFeature):
         Rarity is estimated by comparing the probability of the most recent sample
         against the most probable state in the current window's histogram.
 
+    When streaming over a full `SlidingWindow`, the histogram is kept between
+    calls and only updated with the samples that entered and left the window.
+    It is rebuilt whenever the window range may have changed, i.e. a new
+    sample falls outside it or an expiring sample sat on its boundary.
+
     Read more in the [User Guide](../../user_guide/theoretical_framework/analysis_primitives/rarity.md).
 
     Parameters
@@ -54,6 +60,16 @@ class Rarity(DynamicFeature):
         super().__init__()
         self.alpha = alpha
 
+        # Streaming histogram state, bound to one full SlidingWindow
+        self._window = None
+        self._version = None
+        self._ring_values = None
+        self._ring_bins = None
+        self._counts = None
+        self._lo = self._hi = 0.0
+        self._n_bins = 0
+        self._last_result = None
+
     @property
     def alpha(self) -> float:
         """Scaling factor for rarity."""
@@ -63,6 +79,122 @@ class Rarity(DynamicFeature):
     def alpha(self, value: float):
         self._alpha = validate_numeric(value, "alpha")
 
+    def __call__(self, data: SlidingWindow) -> RarityResult:
+        """Compute rarity for the window, updating the histogram incrementally.
+
+        Parameters
+        ----------
+        data : SlidingWindow
+            Circular buffer containing the time-series data.
+
+        Returns
+        -------
+        RarityResult
+            Same result as `compute` on the window contents.
+        """
+        if data is self._window and data.is_full:
+            new, _, version = data.appended_since(self._version)
+            if new is not None:
+                result = self._update(new.reshape(new.shape[0], -1), version)
+                if result is not None:
+                    return result
+
+        samples, _, version = data.appended_since()
+        if samples.shape[0] == 0:
+            self._window = None
+            return FeatureResult(is_valid=False)
+
+        result = self.compute(samples)
+        self._window = None
+        if data.is_full and samples.shape[0] == data.max_length:
+            self._bind(data, samples.reshape(samples.shape[0], -1), version)
+        self._last_result = result
+        return result
+
+    def _bind(self, data: SlidingWindow, values: np.ndarray, version: tuple) -> None:
+        """Initialize the streaming histogram from a full window of rows."""
+        lo = float(values.min())
+        hi = float(values.max())
+        if not lo < hi:
+            return
+
+        n_bins = max(int(np.sqrt(values.size)), 1)
+        bins = self._bin_index(values, lo, hi, n_bins)
+
+        # Row slots follow the window's own ring layout: sample k lives in
+        # slot k % max_length
+        capacity = data.max_length
+        slots = (version[1] - capacity + np.arange(capacity)) % capacity
+        self._ring_values = np.empty_like(values)
+        self._ring_values[slots] = values
+        self._ring_bins = np.empty_like(bins)
+        self._ring_bins[slots] = bins
+
+        self._counts = np.bincount(bins.ravel(), minlength=n_bins)
+        self._lo, self._hi, self._n_bins = lo, hi, n_bins
+        self._window, self._version = data, version
+
+    def _update(self, new: np.ndarray, version: tuple):
+        """Slide the histogram over the new rows, or return `None` to request a rebuild."""
+        n_new = new.shape[0]
+        if n_new == 0:
+            return self._last_result
+
+        capacity = self._ring_values.shape[0]
+        start = self._version[1] % capacity
+        # Contiguous slots are sliced as views; only a wrap needs an index array
+        if start + n_new <= capacity:
+            slots = slice(start, start + n_new)
+        else:
+            slots = np.arange(start, start + n_new) % capacity
+
+        # A frame holds a handful of values, so the range checks run on
+        # Python floats rather than through NumPy reductions
+        old_values = self._ring_values[slots].ravel().tolist()
+        lo, hi = self._lo, self._hi
+        # The range is unchanged only if nothing new falls outside it (NaNs
+        # fail the comparison) and no boundary value expires
+        if not all(lo <= v <= hi for v in new.ravel().tolist()) or lo in old_values or hi in old_values:
+            return None
+
+        new_bins = self._bin_index(new, lo, hi, self._n_bins)
+        counts = self._counts
+        # Scalar updates beat ufunc.at for this few values
+        for b in self._ring_bins[slots].ravel().tolist():
+            counts[b] -= 1
+        for b in new_bins.ravel().tolist():
+            counts[b] += 1
+        self._ring_values[slots] = new
+        self._ring_bins[slots] = new_bins
+        self._version = version
+
+        result = self._score(counts, int(new_bins[-1, -1]), self._ring_values.size)
+        self._last_result = result
+        return result
+
+    @staticmethod
+    def _bin_index(samples: np.ndarray, lo: float, hi: float, n_bins: int) -> np.ndarray:
+        """Return the histogram bin of each sample for `n_bins` uniform bins over `[lo, hi]`."""
+        # Uniform bins: each bin index is computed directly, with no sort or
+        # binary search. The maximum lands in the last bin, which is closed
+        # on the right as in np.histogram.
+        bin_index = ((samples - lo) * (n_bins / (hi - lo))).astype(np.intp)
+        np.minimum(bin_index, n_bins - 1, out=bin_index)
+        return bin_index
+
+    def _score(self, counts: np.ndarray, last_sample_bin_index: int, n_samples: int) -> RarityResult:
+        """Score the latest sample's bin against the most probable bin."""
+        # Most probable bin vs Current sample bin
+        most_probable_bin_index = int(counts.argmax())
+        most_probable_p = counts[most_probable_bin_index] / n_samples
+        last_sample_p = counts[last_sample_bin_index] / n_samples
+
+        d1 = abs(most_probable_bin_index - last_sample_bin_index)
+        d2 = most_probable_p - last_sample_p
+
+        rarity = d1 * d2 * self._alpha
+        return RarityResult(rarity=float(rarity))
+
     def compute(self, window_data: np.ndarray) -> RarityResult:
         r"""Compute rarity of the latest sample within the window distribution.
 
@@ -89,20 +221,14 @@ class Rarity(DynamicFeature):
 
         # Number of bins
         n_bins = max(int(np.sqrt(n_samples)), 1)
-        counts, bin_edges = np.histogram(samples, bins=n_bins)
-        probabilities = counts / n_samples
 
-        # Most probable bin vs Current sample bin
-        most_probable_bin_index = np.argmax(probabilities)
-        most_probable_p = probabilities[most_probable_bin_index]
+        lo = float(samples.min())
+        hi = float(samples.max())
+        if hi == lo:
+            # Every sample falls in the same bin, which is also the most probable
+            return RarityResult(rarity=0.0)
 
-        last_sample = samples[-1]
-        last_sample_bin_index = np.searchsorted(bin_edges, last_sample, side='right') - 1
-        last_sample_bin_index = np.clip(last_sample_bin_index, 0, n_bins - 1)
-        last_sample_p = probabilities[last_sample_bin_index]
+        bin_index = self._bin_index(samples, lo, hi, n_bins)
+        counts = np.bincount(bin_index, minlength=n_bins)
 
-        d1 = abs(most_probable_bin_index - last_sample_bin_index)
-        d2 = most_probable_p - last_sample_p
-
-        rarity = d1 * d2 * self._alpha
-        return RarityResult(rarity=float(rarity))
\ No newline at end of file
+        return self._score(counts, int(bin_index[-1]), n_samples)
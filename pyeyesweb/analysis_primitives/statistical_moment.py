@@ -8,11 +8,10 @@ variance, skewness, kurtosis) over a sliding window.
 from dataclasses import dataclass
 from typing import Literal, List, Dict, Optional
 import numpy as np
-from scipy import stats
 
 from pyeyesweb.data_models.base import DynamicFeature
 from pyeyesweb.data_models.results import FeatureResult
-from pyeyesweb.utils.validators import validate_string
+from pyeyesweb.utils.validators import validate_float_dtype, validate_string
 
 
 @dataclass(slots=True)
@@ -80,6 +79,9 @@ class StatisticalMoment(DynamicFeature):
     metrics : list of str, optional
         List of moments to compute. Choices: `"mean"`, `"std_dev"`,
         `"skewness"`, `"kurtosis"`. Defaults to `["mean"]`.
+    dtype : {numpy.float32, numpy.float64}, optional
+        Precision used to accumulate the moments. Single precision halves
+        the memory traffic over the window. Defaults to `numpy.float32`.
 
     Examples
     --------
@@ -89,9 +91,11 @@ class StatisticalMoment(DynamicFeature):
     _ALLOWED_METRICS = ["mean", "std_dev", "skewness", "kurtosis"]
     _MIN_SAMPLES = {"mean": 1, "std_dev": 2, "skewness": 3, "kurtosis": 4}
 
-    def __init__(self, metrics: List[Literal["mean", "std_dev", "skewness", "kurtosis"]] = None):
+    def __init__(self, metrics: List[Literal["mean", "std_dev", "skewness", "kurtosis"]] = None,
+                 dtype=np.float32):
         super().__init__()
         self.metrics = metrics
+        self.dtype = dtype
 
     @property
     def metrics(self) -> List[str]:
@@ -103,6 +107,15 @@ class StatisticalMoment(DynamicFeature):
         target_metrics = value or ["mean"]
         self._metrics = [validate_string(m, self._ALLOWED_METRICS) for m in target_metrics]
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating-point precision of the moment computation."""
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        self._dtype = validate_float_dtype(value, "dtype")
+
     def compute(self, window_data: np.ndarray, **kwargs) -> StatisticalMomentResult:
         """Compute requested statistical moments for the window.
 
@@ -121,21 +134,38 @@ class StatisticalMoment(DynamicFeature):
             computed due to insufficient samples.
         """
         # Reshape to (Time, Features)
-        data = window_data.reshape(window_data.shape[0], -1)
+        data = window_data.reshape(window_data.shape[0], -1).astype(self._dtype, copy=False)
         n_samples = data.shape[0]
 
+        active = [m for m in self._metrics if n_samples >= self._MIN_SAMPLES[m]]
+
         results = {}
-        for metric in self._metrics:
-            if n_samples >= self._MIN_SAMPLES[metric]:
-                if metric == "mean":
-                    results["mean"] = np.mean(data, axis=0).tolist()
-                elif metric == "std_dev":
-                    # ddof=1 for sample standard deviation
-                    results["std_dev"] = np.std(data, axis=0, ddof=1).tolist()
-                elif metric == "skewness":
-                    results["skewness"] = stats.skew(data, axis=0).tolist()
-                elif metric == "kurtosis":
-                    results["kurtosis"] = stats.kurtosis(data, axis=0).tolist()
+        if active:
+            # All moments share one mean and one centered copy of the window;
+            # each higher power reuses the squared deviations.
+            mean = data.mean(axis=0)
+            if "mean" in active:
+                results["mean"] = mean.tolist()
+
+            if len(active) > 1 or active[0] != "mean":
+                dx = data - mean
+                dx2 = dx * dx
+                m2 = dx2.mean(axis=0)
+
+                if "std_dev" in active:
+                    # Sample standard deviation (ddof=1)
+                    results["std_dev"] = np.sqrt(m2 * (n_samples / (n_samples - 1))).tolist()
+
+                # Biased (population) estimators, matching scipy.stats defaults;
+                # a numerically constant feature has undefined shape moments.
+                constant = m2 <= (np.finfo(self._dtype).resolution * mean) ** 2
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    if "skewness" in active:
+                        m3 = (dx2 * dx).mean(axis=0)
+                        results["skewness"] = np.where(constant, np.nan, m3 / m2 ** 1.5).tolist()
+                    if "kurtosis" in active:
+                        m4 = (dx2 * dx2).mean(axis=0)
+                        results["kurtosis"] = np.where(constant, np.nan, m4 / (m2 * m2) - 3.0).tolist()
 
         if not results:
             return StatisticalMomentResult(is_valid=False)
@@ -10,7 +10,11 @@ import numpy as np
 
 from pyeyesweb.data_models.base import DynamicFeature
 from pyeyesweb.data_models.results import FeatureResult
-from pyeyesweb.utils.signal_processing import compute_phase_synchronization, validate_and_normalize_filter_params
+from pyeyesweb.utils.signal_processing import (
+    compute_phase_synchronization,
+    design_bandpass_filter,
+    validate_and_normalize_filter_params,
+)
 
 
 @dataclass(slots=True)
@@ -59,6 +63,8 @@ class Synchronization(DynamicFeature):
     @filter_params.setter
     def filter_params(self, value):
         self._filter_params = validate_and_normalize_filter_params(value)
+        # The filter only depends on these parameters, so design it once here
+        self._sos = design_bandpass_filter(self._filter_params) if self._filter_params is not None else None
 
     def compute(self, window_data: np.ndarray) -> SynchronizationResult:
         """Compute the Phase Locking Value (PLV) for the window.
@@ -82,5 +88,5 @@ class Synchronization(DynamicFeature):
             return SynchronizationResult(is_valid=False)
 
         # Assumes compute_phase_synchronization expects a 2D array of (Time, N_Signals)
-        plv = compute_phase_synchronization(data, self.filter_params)
+        plv = compute_phase_synchronization(data, self.filter_params, sos=self._sos)
         return SynchronizationResult(plv=float(plv))
@@ -105,13 +105,11 @@ class StaticFeature(BaseFeature):
             Result for the newest frame. Returns `FeatureResult(is_valid=False)`
             if the window is empty.
         """
-        if len(data) == 0:
+        # Only the newest frame is read, not a copy of the whole window
+        frame_data = data._latest_frame()
+        if frame_data is None:
             return FeatureResult(is_valid=False)
 
-        # Extract the 3D tensor and grab the very last frame (the newest one)
-        tensor, _ = data.to_tensor()
-        frame_data = tensor[-1]
-
         # Delegate to the pure math API. Exceptions will naturally bubble up!
         return self.compute(frame_data)
 
@@ -130,7 +128,10 @@ class DynamicFeature(BaseFeature):
         Parameters
         ----------
         data : numpy.ndarray of shape (Time, N_nodes, N_dims)
-            3D tensor of motion data within the window.
+            3D tensor of motion data within the window. When called through
+            the streaming API this is a read-only array shared with every
+            other feature evaluated on the same window state; copy it before
+            modifying it in place.
 
         Returns
         -------
@@ -143,7 +144,8 @@ class DynamicFeature(BaseFeature):
         """The Streaming API for dynamic features.
 
         Extracts the full chronological tensor from the `SlidingWindow` and
-        passes it to the `compute` method.
+        passes it to the `compute` method. The tensor is a read-only snapshot
+        reused by all features until the window changes.
 
         Parameters
         ----------
@@ -159,8 +161,9 @@ class DynamicFeature(BaseFeature):
         if len(data) == 0:
             return FeatureResult(is_valid=False)
 
-        # Extract the 3D tensor
-        tensor, _ = data.to_tensor()
+        # Read-only tensor shared with every other feature evaluated on
+        # this window before the next append
+        tensor, _ = data._snapshot()
 
         # Delegate to the pure math API. Exceptions will naturally bubble up!
         return self.compute(tensor)
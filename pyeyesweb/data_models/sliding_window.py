@@ -1,26 +1,33 @@
 """Circular buffer implementation for real-time motion data streaming.
 
 This module provides the [SlidingWindow][pyeyesweb.data_models.sliding_window.SlidingWindow]
-class, a thread-safe circular buffer designed for high-frequency motion
-data.  It maintains a fixed-size history of samples and supports dynamic
-resizing.
+class, a single-producer/single-consumer circular buffer designed for
+high-frequency motion data.  It maintains a fixed-size history of samples and
+supports dynamic resizing.
 """
 
 import time
-import threading
 import numpy as np
-from typing import Optional, Union
-from pyeyesweb.utils.validators import validate_integer
+from typing import Literal, Optional, Union
+from pyeyesweb.utils.validators import validate_integer, validate_string
 
 
 class SlidingWindow:
-    """Thread-safe sliding window buffer for storing samples with timestamps.
+    """Sliding window buffer for storing samples with timestamps.
 
     This class implements a circular buffer that maintains a fixed-size window
     of the most recent samples. When the buffer is full, new samples overwrite
     the oldest ones. The internal data shape is strictly maintained as a 3D
     tensor: `(Time, Signals, Dimensions)`.
 
+    !!! note
+        The window is lock-free for one producer and any number of readers.
+        `append`, `reset` and resizing through `max_length` must all be
+        called from the producer thread. `to_tensor`, `appended_since` and
+        the other readers may run on any thread: they copy the buffer and
+        retry if the producer overwrote the copied region, or reset or
+        resized the window, while they were copying.
+
     Parameters
     ----------
     max_length : int
@@ -46,14 +53,29 @@ class SlidingWindow:
         self._n_signals = validate_integer(n_signals, 'n_signals', min_val=1, max_val=1000)
         self._n_dims = validate_integer(n_dims, 'n_dims', min_val=1, max_val=10_000)
 
-        self._lock = threading.RLock()
-
         # Initialize with NaNs to ensure algorithms don't process garbage memory
         self._buffer = np.full((self._max_length, self._n_signals, self._n_dims), np.nan, dtype=np.float32)
         self._timestamp = np.full(self._max_length, np.nan, dtype=np.float64)
-
-        self._start = 0
-        self._size = 0
+        self._n_columns = self._n_signals * self._n_dims
+        self._rows = self._buffer.reshape(self._max_length, self._n_columns)
+        # Staging row: flat list samples are converted here before the slot
+        # they replace is announced, so a rejected sample never clobbers it
+        self._scratch = np.empty(self._n_columns, dtype=np.float32)
+
+        # `_write_pos` counts every sample ever published; sample k lives in
+        # slot k % max_length. `_writing` is set to k + 1 before sample k is
+        # written, so readers can tell which slots changed while copying.
+        self._write_pos = 0
+        self._writing = 0
+        # Producer-side slot of the next write, i.e. `_write_pos % max_length`,
+        # advanced by conditional subtraction to keep division off `append`
+        self._slot = 0
+        # Incremented when a reset or resize starts and again when it ends:
+        # odd while the window is being rearranged. Versions handed out by
+        # `appended_since` before a change are rejected afterwards.
+        self._epoch = 0
+        # `(version, tensor, timestamps)` of the last shared snapshot
+        self._snapshot_cache = None
 
     @property
     def max_length(self) -> int:
@@ -65,9 +87,7 @@ class SlidingWindow:
         if value <= 0:
             raise ValueError("max_length must be positive.")
         if value != self._max_length:
-            old_max_length = self._max_length
-            self._max_length = value
-            self._resize(old_max_length)
+            self._resize(value)
 
     @property
     def n_signals(self) -> int:
@@ -82,43 +102,48 @@ class SlidingWindow:
     @property
     def is_full(self) -> bool:
         """Check if the sliding window buffer is at maximum capacity."""
-        with self._lock:
-            return self._size == self._max_length
+        return self._write_pos >= self._max_length
 
     def __len__(self) -> int:
         """Return the current number of samples in the sliding window."""
-        with self._lock:
-            return self._size
+        return min(self._write_pos, self._max_length)
 
     def __repr__(self) -> str:
         """Return a concise representation showing state and shape."""
         data, _ = self.to_tensor()
-        return f"SlidingWindow(size={self._size}/{self._max_length}, shape=(T, {self._n_signals}, {self._n_dims}))\ndata=\n{data}"
-
-    def _resize(self, old_max_length: int):
-        with self._lock:
-            indices = (self._start + np.arange(self._size)) % old_max_length
-            old_data = self._buffer[indices].copy()
-            old_timestamps = self._timestamp[indices].copy()
-
-            new_buffer = np.full((self._max_length, self._n_signals, self._n_dims), np.nan, dtype=np.float32)
-            new_timestamps = np.full(self._max_length, np.nan, dtype=np.float64)
-
-            keep = min(len(old_data), self._max_length)
-            if keep > 0:
-                new_buffer[:keep, :, :] = old_data[-keep:, :, :]
-                new_timestamps[:keep] = old_timestamps[-keep:]
-
-            self._buffer = new_buffer
-            self._timestamp = new_timestamps
-            self._start = 0
-            self._size = keep
+        return f"SlidingWindow(size={len(data)}/{self._max_length}, shape=(T, {self._n_signals}, {self._n_dims}))\ndata=\n{data}"
+
+    def _resize(self, new_max_length: int):
+        self._epoch += 1
+        old_max_length = self._max_length
+        self._max_length = new_max_length
+        start, size = self._span(self._write_pos, old_max_length)
+        old_data = self._ordered(self._buffer, start, size, old_max_length)
+        old_timestamps = self._ordered(self._timestamp, start, size, old_max_length)
+
+        new_buffer = np.full((self._max_length, self._n_signals, self._n_dims), np.nan, dtype=np.float32)
+        new_timestamps = np.full(self._max_length, np.nan, dtype=np.float64)
+
+        keep = min(len(old_data), self._max_length)
+        if keep > 0:
+            new_buffer[:keep, :, :] = old_data[-keep:, :, :]
+            new_timestamps[:keep] = old_timestamps[-keep:]
+
+        self._buffer = new_buffer
+        self._timestamp = new_timestamps
+        self._rows = new_buffer.reshape(self._max_length, self._n_columns)
+        self._write_pos = keep
+        self._writing = keep
+        self._slot = keep if keep < self._max_length else 0
+        self._epoch += 1
 
     def append(self, sample: Union[list, np.ndarray, float, int], timestamp: Optional[float] = None) -> None:
         """Append a new sample to the sliding window.
 
         Accepts scalars, flat lists, or shaped numpy arrays, and automatically
         reshapes them to fit the configured `(n_signals, n_dims)` structure.
+        A sample or timestamp that cannot be converted is rejected before the
+        window is modified.
 
         Parameters
         ----------
@@ -128,29 +153,51 @@ class SlidingWindow:
             Monotonic timestamp for the sample.  If `None`, `time.monotonic()`
             is used.
         """
-        sample_arr = np.asarray(sample, dtype=np.float32)
-
+        timestamp = time.monotonic() if timestamp is None else float(timestamp)
+
+        # Fast paths: scalars and flat lists/tuples of the right length skip
+        # the `np.asarray` + `reshape` round trip.
+        row = None
+        if self._n_columns == 1 and isinstance(sample, (int, float)):
+            row = float(sample)
+        elif isinstance(sample, (list, tuple)) and len(sample) == self._n_columns:
+            try:
+                self._scratch[:] = sample
+                row = self._scratch
+            except ValueError:
+                # Nested sequences, e.g. `[[x], [y]]`; use the generic path.
+                pass
+
+        frame = None
+        if row is None:
+            sample_arr = np.asarray(sample, dtype=np.float32)
+            try:
+                frame = sample_arr.reshape(self._n_signals, self._n_dims)
+            except ValueError:
+                raise ValueError(
+                    f"Cannot reshape input of size {sample_arr.size} into "
+                    f"expected shape ({self._n_signals} signals, {self._n_dims} dims)."
+                )
+
+        pos = self._write_pos
+        idx = self._slot
+        # Announce the slot before overwriting it
+        self._writing = pos + 1
         try:
-            sample_reshaped = sample_arr.reshape(self._n_signals, self._n_dims)
-        except ValueError:
-            raise ValueError(
-                f"Cannot reshape input of size {sample_arr.size} into "
-                f"expected shape ({self._n_signals} signals, {self._n_dims} dims)."
-            )
-
-        with self._lock:
-            if timestamp is None:
-                timestamp = time.monotonic()
-
-            if self._size < self._max_length:
-                idx = (self._start + self._size) % self._max_length
-                self._size += 1
+            if frame is None:
+                self._rows[idx] = row
             else:
-                idx = self._start
-                self._start = (self._start + 1) % self._max_length
-
-            self._buffer[idx] = sample_reshaped
+                self._buffer[idx] = frame
             self._timestamp[idx] = timestamp
+        except BaseException:
+            self._writing = pos
+            raise
+        next_idx = idx + 1
+        if next_idx >= self._max_length:
+            next_idx -= self._max_length
+        self._slot = next_idx
+        # Publish the slot by bumping the write counter
+        self._write_pos = pos + 1
 
     def to_tensor(self) -> tuple[np.ndarray, np.ndarray]:
         """Return the contents as a 3D tensor of shape `(Time, Signals, Dimensions)`.
@@ -162,13 +209,134 @@ class SlidingWindow:
         timestamps : numpy.ndarray
             Array of shape `(current_size,)` containing corresponding timestamps.
         """
-        with self._lock:
-            indices = (self._start + np.arange(self._size)) % self._max_length
-            return self._buffer[indices].copy(), self._timestamp[indices].copy()
+        tensor, timestamps, _ = self._read_newest()
+        return tensor, timestamps
+
+    def appended_since(self, version: Optional[tuple[int, int]] = None) -> tuple:
+        """Return the samples appended after a previously returned version.
+
+        Lets streaming consumers update incremental state from only the new
+        samples instead of re-reading the whole window.
+
+        Parameters
+        ----------
+        version : tuple of int, optional
+            Version returned by an earlier call. If `None`, the whole
+            window is returned.
+
+        Returns
+        -------
+        samples : numpy.ndarray or None
+            Array of shape `(n_new, n_signals, n_dims)` in chronological
+            order, or `None` if `version` predates a `reset` or resize, or if
+            more than `max_length` samples were appended since.
+        timestamps : numpy.ndarray or None
+            Array of shape `(n_new,)` with the corresponding timestamps, or
+            `None` together with `samples`.
+        version : tuple of int
+            Current version, to pass to the next call.
+        """
+        return self._read_newest(since=version)
 
-    def to_flat_array(self) -> tuple[np.ndarray, np.ndarray]:
+    def _snapshot(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return a read-only chronological `(tensor, timestamps)` shared between readers.
+
+        Unlike `to_tensor`, the copy is made once per window state: every
+        feature evaluated on the same window between two appends receives
+        the same arrays. They are read-only so no consumer can alter what
+        the others see.
+        """
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] == (self._epoch, self._write_pos):
+            return cached[1], cached[2]
+
+        tensor, timestamps, version = self._read_newest()
+        tensor.flags.writeable = False
+        timestamps.flags.writeable = False
+        self._snapshot_cache = (version, tensor, timestamps)
+        return tensor, timestamps
+
+    def _latest_frame(self) -> Optional[np.ndarray]:
+        """Return a copy of the newest `(n_signals, n_dims)` frame, or `None` if empty."""
+        # Single-row version of `_read_newest`, kept separate because
+        # static features call it on every evaluation
+        while True:
+            epoch = self._epoch
+            write_pos = self._write_pos
+            buffer, capacity = self._buffer, self._max_length
+            if epoch % 2:
+                continue
+            frame = buffer[(write_pos - 1) % capacity].copy() if write_pos else None
+            if self._epoch == epoch and self._writing - write_pos < capacity:
+                return frame
+
+    def _read_newest(self, since: Optional[tuple[int, int]] = None) -> tuple:
+        """Copy the newest samples consistently with a concurrent producer.
+
+        Copies the samples appended after version `since` (all samples if
+        `None`). The copy is retried if, by the time it finished, the
+        producer had announced a write into one of the copied slots or a
+        reset or resize had started.
+
+        Returns
+        -------
+        tuple
+            `(samples, timestamps, version)` as in `appended_since`, with
+            `samples` and `timestamps` set to `None` if `since` is stale.
+        """
+        while True:
+            epoch = self._epoch
+            write_pos = self._write_pos
+            buffer, timestamp, capacity = self._buffer, self._timestamp, self._max_length
+            if epoch % 2:
+                continue  # reset or resize in progress
+
+            if since is None:
+                n = min(write_pos, capacity)
+            else:
+                n = write_pos - since[1]
+                if since[0] != epoch or not 0 <= n <= capacity:
+                    if self._epoch == epoch:
+                        return None, None, (epoch, write_pos)
+                    continue
+
+            start = (write_pos - n) % capacity
+            samples = self._ordered(buffer, start, n, capacity)
+            timestamps = self._ordered(timestamp, start, n, capacity)
+
+            # Writes announced since `write_pos` was read overwrite the
+            # oldest slots first; the copy holds if none reached it.
+            if self._epoch == epoch and self._writing - write_pos <= capacity - n:
+                return samples, timestamps, (epoch, write_pos)
+
+    @staticmethod
+    def _span(write_pos: int, capacity: int) -> tuple[int, int]:
+        """Return `(start, size)` of the occupied region for a write-counter snapshot."""
+        size = min(write_pos, capacity)
+        return (write_pos - size) % capacity, size
+
+    @staticmethod
+    def _ordered(array: np.ndarray, start: int, size: int, capacity: int) -> np.ndarray:
+        """Return a chronological copy of the occupied region of `array`.
+
+        The occupied region is gathered with at most two contiguous slices,
+        so no index array is allocated and the result is always contiguous.
+        """
+        end = start + size
+        if end <= capacity:
+            return array[start:end].copy()
+        return np.concatenate((array[start:], array[:end - capacity]))
+
+    def to_flat_array(self, order: Literal["C", "F"] = "C") -> tuple[np.ndarray, np.ndarray]:
         """Return the contents flattened to `(Time, Signals * Dimensions)`.
 
+        Parameters
+        ----------
+        order : {"C", "F"}, optional
+            Memory layout of the returned array. `"F"` (column-major) makes
+            each feature column contiguous, which suits consumers that
+            process one signal at a time. Default is `"C"`.
+
         Returns
         -------
         flat_array : numpy.ndarray
@@ -176,17 +344,34 @@ class SlidingWindow:
         timestamps : numpy.ndarray
             Array of shape `(current_size,)` containing corresponding timestamps.
         """
+        validate_string(order, ["C", "F"])
         tensor, timestamps = self.to_tensor()
         if tensor.size == 0:
-            return np.empty((0, self._n_signals * self._n_dims), dtype=np.float32), timestamps
+            return np.empty((0, self._n_signals * self._n_dims), dtype=np.float32, order=order), timestamps
 
-        flat_array = tensor.reshape(self._size, self._n_signals * self._n_dims)
+        flat_array = tensor.reshape(tensor.shape[0], self._n_signals * self._n_dims)
+        if order == "F":
+            flat_array = np.asfortranarray(flat_array)
         return flat_array, timestamps
 
-    def reset(self) -> None:
-        """Clear all data from the window and reset buffers with NaNs."""
-        with self._lock:
-            self._start = 0
-            self._size = 0
+    def reset(self, debug: bool = False) -> None:
+        """Clear all data from the window.
+
+        Only the write counters are reset: readers never look past the
+        occupied region, so the stale samples are simply overwritten by
+        later appends.
+
+        Parameters
+        ----------
+        debug : bool, optional
+            If `True`, also overwrite the buffers with NaNs so stale data is
+            easy to spot when inspecting the internals. Default is `False`.
+        """
+        self._epoch += 1
+        self._write_pos = 0
+        self._writing = 0
+        self._slot = 0
+        if debug:
             self._buffer.fill(np.nan)
-            self._timestamp.fill(np.nan)
\ No newline at end of file
+            self._timestamp.fill(np.nan)
+        self._epoch += 1
\ No newline at end of file
@@ -7,8 +7,10 @@ changes relative to a movement baseline.
 """
 
 import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Union
 
 import numpy as np
 from scipy.spatial import ConvexHull
@@ -16,6 +18,304 @@ from scipy.spatial import QhullError
 
 from pyeyesweb.data_models.base import StaticFeature
 from pyeyesweb.data_models.results import FeatureResult
+from pyeyesweb.utils.jit import NUMBA_AVAILABLE, njit
+
+# Above this many points Qhull beats the brute-force supporting-plane search
+_SMALL_HULL_MAX_POINTS = 25
+
+# Lower bound on (smallest / largest) PCA variance for the small-hull kernel.
+# Thinner clouds hit its fixed coplanarity tolerances, so they go to Qhull.
+_SMALL_HULL_MIN_VARIANCE_RATIO = 1e-8
+
+# Row k selects, per axis, the min (0) or max (1) for the k-th box corner,
+# in itertools.product order
+_AABB_CORNER_BITS = np.array(list(itertools.product((0, 1), repeat=3)), dtype=bool)
+
+
+@njit(cache=True)
+def _aabb_bounds(points):
+    """Return the per-axis minima and maxima of the `(N, 3)` points in a single pass."""
+    mins = np.empty(3, points.dtype)
+    maxs = np.empty(3, points.dtype)
+    for k in range(3):
+        mins[k] = points[0, k]
+        maxs[k] = points[0, k]
+    for i in range(1, points.shape[0]):
+        for k in range(3):
+            v = points[i, k]
+            if v < mins[k]:
+                mins[k] = v
+            elif v > maxs[k]:
+                maxs[k] = v
+    return mins, maxs
+
+
+@njit(cache=True)
+def _aabb_area_kernel(points):
+    """Return the surface area of the bounding box of the `(N, 3)` points."""
+    mins, maxs = _aabb_bounds(points)
+    dx = maxs[0] - mins[0]
+    dy = maxs[1] - mins[1]
+    dz = maxs[2] - mins[2]
+    return 2.0 * (dx * dy + dx * dz + dy * dz)
+
+
+@njit(cache=True)
+def _aabb_kernel(points):
+    """Return the surface area and the 8 corners of the bounding box of `points`.
+
+    The corners are written in the same order as `_AABB_CORNER_BITS`.
+    """
+    mins, maxs = _aabb_bounds(points)
+    dx = maxs[0] - mins[0]
+    dy = maxs[1] - mins[1]
+    dz = maxs[2] - mins[2]
+    surface_area = 2.0 * (dx * dy + dx * dz + dy * dz)
+
+    corners = np.empty((8, 3), points.dtype)
+    for c in range(8):
+        corners[c, 0] = maxs[0] if c & 4 else mins[0]
+        corners[c, 1] = maxs[1] if c & 2 else mins[1]
+        corners[c, 2] = maxs[2] if c & 1 else mins[2]
+    return surface_area, corners
+
+
+@njit(cache=True)
+def _points_density_kernel(points):
+    """Return the mean distance of the `(N, D)` points from their barycenter.
+
+    The barycenter and the distances are accumulated in two passes over
+    the points, without the `diff` temporary of the NumPy formulation.
+    """
+    n, d = points.shape
+    center = np.zeros(d)
+    for i in range(n):
+        for k in range(d):
+            center[k] += points[i, k]
+    for k in range(d):
+        center[k] /= n
+
+    total = 0.0
+    for i in range(n):
+        sq = 0.0
+        for k in range(d):
+            delta = points[i, k] - center[k]
+            sq += delta * delta
+        total += np.sqrt(sq)
+    return total / n
+
+
+@njit(cache=True)
+def _face_polygon_area(points, members, n_members, origin, u, v, tol, is_vertex):
+    """Area of the 2D convex hull of coplanar `points[members[:n_members]]`.
+
+    The points are expressed in the in-plane basis `(u, v)` around
+    `origin` and wrapped with a gift-wrapping march, which also flags the
+    hull corners in `is_vertex`. Points lying on an edge are skipped by
+    always advancing to the farthest collinear candidate.
+    """
+    xs = np.empty(n_members)
+    ys = np.empty(n_members)
+    start = 0
+    for a in range(n_members):
+        m = members[a]
+        dx = points[m, 0] - origin[0]
+        dy = points[m, 1] - origin[1]
+        dz = points[m, 2] - origin[2]
+        xs[a] = dx * u[0] + dy * u[1] + dz * u[2]
+        ys[a] = dx * v[0] + dy * v[1] + dz * v[2]
+        if xs[a] < xs[start] or (xs[a] == xs[start] and ys[a] < ys[start]):
+            start = a
+
+    twice_area = 0.0
+    current = start
+    for _ in range(n_members):
+        is_vertex[members[current]] = True
+        candidate = 0 if current != 0 else 1
+        for r in range(n_members):
+            if r == current or r == candidate:
+                continue
+            ax = xs[candidate] - xs[current]
+            ay = ys[candidate] - ys[current]
+            bx = xs[r] - xs[current]
+            by = ys[r] - ys[current]
+            turn = ax * by - ay * bx
+            if turn < -tol or (turn <= tol and bx * bx + by * by > ax * ax + ay * ay):
+                candidate = r
+        twice_area += xs[current] * ys[candidate] - xs[candidate] * ys[current]
+        current = candidate
+        # Compare positions, not indices, so duplicates of the start close the loop
+        if xs[current] == xs[start] and ys[current] == ys[start]:
+            break
+    return 0.5 * abs(twice_area)
+
+
+@njit(cache=True)
+def _is_first_triple(points, members, n_members, i, j, k, scale):
+    """Whether `(i, j, k)` is the lowest-index triple spanning the plane of `members`.
+
+    That triple is the first member, the next member distinct from it and
+    the next member not collinear with those two.
+    """
+    first = members[0]
+    second = -1
+    for a in range(1, n_members):
+        m = members[a]
+        if (points[m, 0] != points[first, 0] or points[m, 1] != points[first, 1]
+                or points[m, 2] != points[first, 2]):
+            second = m
+            break
+    if first != i or second != j:
+        return False
+
+    e1x = points[j, 0] - points[i, 0]
+    e1y = points[j, 1] - points[i, 1]
+    e1z = points[j, 2] - points[i, 2]
+    for a in range(n_members):
+        m = members[a]
+        if m <= j:
+            continue
+        e2x = points[m, 0] - points[i, 0]
+        e2y = points[m, 1] - points[i, 1]
+        e2z = points[m, 2] - points[i, 2]
+        cx = e1y * e2z - e1z * e2y
+        cy = e1z * e2x - e1x * e2z
+        cz = e1x * e2y - e1y * e2x
+        if np.sqrt(cx * cx + cy * cy + cz * cz) > 1e-12 * scale * scale:
+            return m == k
+    return False
+
+
+@njit(cache=True, nogil=True)
+def _spans_volume(points):
+    """Whether the cloud is thick enough in every direction for `_small_hull_kernel`.
+
+    Uses det(C) / trace(C)**3 of the scatter matrix C, a lower bound on
+    the ratio of its smallest to largest eigenvalue, so near-planar and
+    near-collinear clouds are rejected whatever their orientation.
+    """
+    n = points.shape[0]
+    cx = 0.0
+    cy = 0.0
+    cz = 0.0
+    for m in range(n):
+        cx += points[m, 0]
+        cy += points[m, 1]
+        cz += points[m, 2]
+    cx /= n
+    cy /= n
+    cz /= n
+    sxx = sxy = sxz = syy = syz = szz = 0.0
+    for m in range(n):
+        dx = points[m, 0] - cx
+        dy = points[m, 1] - cy
+        dz = points[m, 2] - cz
+        sxx += dx * dx
+        sxy += dx * dy
+        sxz += dx * dz
+        syy += dy * dy
+        syz += dy * dz
+        szz += dz * dz
+    trace = sxx + syy + szz
+    if trace == 0.0:
+        return False
+    det = (sxx * (syy * szz - syz * syz)
+           - sxy * (sxy * szz - syz * sxz)
+           + sxz * (sxy * syz - syy * sxz))
+    return det >= _SMALL_HULL_MIN_VARIANCE_RATIO * trace * trace * trace
+
+
+@njit(cache=True, nogil=True)
+def _small_hull_kernel(points):
+    """Surface area and vertex mask of the 3D convex hull of a few points.
+
+    Every triple of points spanning a plane with all other points on one
+    side is a supporting plane. Each such plane is visited once, from the
+    triple made of its lowest-index points, and contributes the area of
+    the convex polygon formed by the points lying on it. A set with no
+    volume has no hull, as with Qhull, and yields an area of 0.
+    """
+    n = points.shape[0]
+    is_vertex = np.zeros(n, dtype=np.bool_)
+
+    scale = 0.0
+    for k in range(3):
+        lo = points[0, k]
+        hi = points[0, k]
+        for m in range(1, n):
+            lo = min(lo, points[m, k])
+            hi = max(hi, points[m, k])
+        scale = max(scale, hi - lo)
+    if scale == 0.0:
+        return 0.0, is_vertex
+
+    members = np.empty(n, dtype=np.intp)
+    normal = np.empty(3)
+    u = np.empty(3)
+    v = np.empty(3)
+    area = 0.0
+    flat = True
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            e1x = points[j, 0] - points[i, 0]
+            e1y = points[j, 1] - points[i, 1]
+            e1z = points[j, 2] - points[i, 2]
+            for k in range(j + 1, n):
+                e2x = points[k, 0] - points[i, 0]
+                e2y = points[k, 1] - points[i, 1]
+                e2z = points[k, 2] - points[i, 2]
+                normal[0] = e1y * e2z - e1z * e2y
+                normal[1] = e1z * e2x - e1x * e2z
+                normal[2] = e1x * e2y - e1y * e2x
+                norm = np.sqrt(normal[0] ** 2 + normal[1] ** 2 + normal[2] ** 2)
+                if norm <= 1e-12 * scale * scale:
+                    continue  # collinear triple
+
+                tol = 1e-9 * norm * scale
+                above = False
+                below = False
+                n_members = 0
+                for m in range(n):
+                    side = (normal[0] * (points[m, 0] - points[i, 0])
+                            + normal[1] * (points[m, 1] - points[i, 1])
+                            + normal[2] * (points[m, 2] - points[i, 2]))
+                    if side > tol:
+                        above = True
+                    elif side < -tol:
+                        below = True
+                    else:
+                        members[n_members] = m
+                        n_members += 1
+                    if above and below:
+                        break
+                if above and below:
+                    continue
+                flat = flat and not (above or below)
+                if n_members > 3 and not _is_first_triple(points, members, n_members, i, j, k, scale):
+                    continue
+
+                inv = 1.0 / np.sqrt(e1x * e1x + e1y * e1y + e1z * e1z)
+                u[0] = e1x * inv
+                u[1] = e1y * inv
+                u[2] = e1z * inv
+                v[0] = (normal[1] * u[2] - normal[2] * u[1]) / norm
+                v[1] = (normal[2] * u[0] - normal[0] * u[2]) / norm
+                v[2] = (normal[0] * u[1] - normal[1] * u[0]) / norm
+                area += _face_polygon_area(points, members, n_members, points[i], u, v,
+                                           1e-12 * scale * scale, is_vertex)
+
+    if flat:
+        return 0.0, np.zeros(n, dtype=np.bool_)
+    return area, is_vertex
+
+
+def _as_frames(frames: np.ndarray, name: str) -> np.ndarray:
+    """Return `frames` as an array, checking it is a `(Time, N_points, N_dims)` stack."""
+    frames = np.asarray(frames)
+    if frames.ndim != 3:
+        raise ValueError(f"{name}.compute_batch expects a 3D array of shape (Time, N_points, N_dims).")
+    return frames
 
 
 @dataclass(slots=True)
@@ -59,36 +359,78 @@ class BoundingBoxFilledArea(StaticFeature):
 
     EPSILON = 1e-6
 
+    @staticmethod
+    def _small_hull_points(points: np.ndarray) -> Optional[np.ndarray]:
+        """Return `points` as float64 if `_small_hull_kernel` can take them, else `None`.
+
+        That is when they are few, 3D and well-conditioned enough.
+        """
+        if not (NUMBA_AVAILABLE and len(points) <= _SMALL_HULL_MAX_POINTS and points.shape[1] == 3):
+            return None
+        points = np.asarray(points, dtype=np.float64)
+        return points if _spans_volume(points) else None
+
+    @staticmethod
+    def _get_hull_area(points: np.ndarray) -> float:
+        """Return the convex hull surface area, without gathering its vertices."""
+        if len(points) < 4:
+            return 0.0
+        small = BoundingBoxFilledArea._small_hull_points(points)
+        if small is not None:
+            # Skeleton-sized inputs: skip Qhull's setup cost
+            return _small_hull_kernel(small)[0]
+        try:
+            return ConvexHull(points).area
+        except QhullError:
+            # specifically catch geometric degeneracy (e.g., planar/collinear points)
+            return 0.0
+
+    @staticmethod
+    def _get_aabb_area(points: np.ndarray) -> float:
+        """Return the bounding box surface area, without building its corners."""
+        if len(points) == 0:
+            return 0.0
+
+        if NUMBA_AVAILABLE and points.shape[1] == 3:
+            # The kernels are unrolled for 3D points
+            return _aabb_area_kernel(points)
+
+        dims = np.max(points, axis=0) - np.min(points, axis=0)
+        return 2 * (dims[0] * dims[1] + dims[0] * dims[2] + dims[1] * dims[2])
+
     @staticmethod
     def _get_hull_data(points: np.ndarray) -> tuple[float, np.ndarray]:
+        """Return the convex hull surface area and vertices."""
         if len(points) < 4:
             return 0.0, np.array([])
+        small = BoundingBoxFilledArea._small_hull_points(points)
+        if small is not None:
+            area, is_vertex = _small_hull_kernel(small)
+            if area == 0.0:
+                return 0.0, np.array([])
+            return area, points[is_vertex]
         try:
             hull = ConvexHull(points)
             return hull.area, points[hull.vertices]
         except QhullError:
-            # specifically catch geometric degeneracy (e.g., planar/collinear points)
             return 0.0, np.array([])
 
     @staticmethod
     def _get_aabb_data(points: np.ndarray) -> tuple[float, np.ndarray]:
+        """Return the bounding box surface area and its 8 corners."""
         if len(points) == 0:
             return 0.0, np.array([])
 
+        if NUMBA_AVAILABLE and points.shape[1] == 3:
+            # The kernels are unrolled for 3D points
+            return _aabb_kernel(points)
+
         min_vals = np.min(points, axis=0)
         max_vals = np.max(points, axis=0)
         dims = max_vals - min_vals
         surface_area = 2 * (dims[0] * dims[1] + dims[0] * dims[2] + dims[1] * dims[2])
 
-        corners = np.array(
-            list(
-                itertools.product(
-                    [min_vals[0], max_vals[0]],
-                    [min_vals[1], max_vals[1]],
-                    [min_vals[2], max_vals[2]],
-                )
-            )
-        )
+        corners = np.where(_AABB_CORNER_BITS, max_vals, min_vals)
         return surface_area, corners
 
     def compute(self, frame_data: np.ndarray) -> ContractionExpansionResult:
@@ -104,13 +446,53 @@ class BoundingBoxFilledArea(StaticFeature):
         ContractionExpansionResult
             The computed contraction index.
         """
-        hull_area, hull_points = self._get_hull_data(frame_data)
-        bbox_area, bbox_points = self._get_aabb_data(frame_data)
+        # The result only carries the ratio, so the hull vertices and box
+        # corners are never materialized here
+        hull_area = self._get_hull_area(frame_data)
+        bbox_area = self._get_aabb_area(frame_data)
 
         index = (hull_area / bbox_area) if bbox_area > self.EPSILON else 0.0
 
         return ContractionExpansionResult(contraction_index=float(index))
 
+    def compute_batch(self, frames: np.ndarray) -> List[ContractionExpansionResult]:
+        """Compute the Contraction Index for every frame of a window.
+
+        The bounding boxes of all frames are computed in single vectorized
+        reductions over the time axis. The convex hulls are built per frame
+        on a thread pool; both Qhull and the small-hull kernel release the
+        GIL while they run.
+
+        Parameters
+        ----------
+        frames : numpy.ndarray of shape (Time, N_points, 3)
+            One frame of points per time step.
+
+        Returns
+        -------
+        list of ContractionExpansionResult
+            One result per frame, in the same order.
+        """
+        frames = _as_frames(frames, "BoundingBoxFilledArea")
+        if frames.shape[1] == 0:
+            return [ContractionExpansionResult(contraction_index=0.0) for _ in range(len(frames))]
+
+        dims = frames.max(axis=1) - frames.min(axis=1)
+        bbox_areas = 2 * (dims[:, 0] * dims[:, 1] + dims[:, 0] * dims[:, 2] + dims[:, 1] * dims[:, 2])
+
+        n_workers = min(len(frames), os.cpu_count() or 1)
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                hull_areas = list(executor.map(self._get_hull_area, frames))
+        else:
+            hull_areas = [self._get_hull_area(frame) for frame in frames]
+
+        results = []
+        for hull, bbox_area in zip(hull_areas, bbox_areas):
+            index = (hull / bbox_area) if bbox_area > self.EPSILON else 0.0
+            results.append(ContractionExpansionResult(contraction_index=float(index)))
+        return results
+
 
 class EllipsoidSphericity(StaticFeature):
     r"""Fits an ellipsoid to skeletal joints using PCA and computes shape metrics.
@@ -133,22 +515,39 @@ class EllipsoidSphericity(StaticFeature):
     EPSILON = 1e-6
 
     @staticmethod
-    def _fit_ellipsoid_pca(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    def _fit_ellipsoid_pca(
+            points: np.ndarray, return_axes: bool = False
+    ) -> Union[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+        """Return the ellipsoid radii, largest first, and optionally its axes.
+
+        Sphericity only needs the radii, so by default only the eigenvalues
+        are computed (`eigvalsh`). The eigenvectors, one axis per column in
+        the same order as the radii, are computed with `eigh` only when
+        `return_axes` is `True`.
+        """
+        dtype = points.dtype if points.dtype == np.float32 else np.float64
         if len(points) < 2:
-            return np.zeros(3), np.eye(3)
+            radii, axes = np.zeros(3, dtype), np.eye(3, dtype=dtype)
+            return (radii, axes) if return_axes else radii
 
         centered = points - np.mean(points, axis=0)
-        cov_matrix = np.cov(centered, rowvar=False)
+        # Scatter matrix; the covariance normalization is applied to the
+        # three eigenvalues instead of the whole matrix
+        scatter = centered.T @ centered
 
         try:
-            eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix)
+            if return_axes:
+                eigenvalues, eigenvectors = np.linalg.eigh(scatter)
+            else:
+                eigenvalues = np.linalg.eigvalsh(scatter)
         except np.linalg.LinAlgError:
-            return np.zeros(3), np.eye(3)
+            radii, axes = np.zeros(3, dtype), np.eye(3, dtype=dtype)
+            return (radii, axes) if return_axes else radii
 
-        radii = np.sqrt(np.abs(eigenvalues))
-        sort_indices = np.argsort(radii)[::-1]
+        # eigh returns ascending eigenvalues, so largest-first is a reversal
+        radii = np.sqrt(np.abs(eigenvalues[::-1]) / (len(points) - 1))
 
-        return radii[sort_indices], eigenvectors[:, sort_indices]
+        return (radii, eigenvectors[:, ::-1]) if return_axes else radii
 
     def compute(self, frame_data: np.ndarray) -> ContractionExpansionResult:
         """Compute the Sphericity based on fitted ellipsoid radii.
@@ -163,7 +562,7 @@ class EllipsoidSphericity(StaticFeature):
         ContractionExpansionResult
             The computed sphericity metric.
         """
-        radii, rotation = self._fit_ellipsoid_pca(frame_data)
+        radii = self._fit_ellipsoid_pca(frame_data)
         a, b, c = radii[0], radii[1], radii[2]
 
         if a < self.EPSILON:
@@ -171,6 +570,39 @@ class EllipsoidSphericity(StaticFeature):
 
         return ContractionExpansionResult(sphericity=float(c / a))
 
+    def compute_batch(self, frames: np.ndarray) -> List[ContractionExpansionResult]:
+        """Compute the Sphericity for every frame of a window.
+
+        The `(Time, 3, 3)` scatter matrices of all frames are built with one
+        `einsum` and decomposed by a single stacked `eigvalsh` call, instead
+        of one LAPACK call per frame.
+
+        Parameters
+        ----------
+        frames : numpy.ndarray of shape (Time, N_points, 3)
+            One frame of points per time step.
+
+        Returns
+        -------
+        list of ContractionExpansionResult
+            One result per frame, in the same order.
+        """
+        frames = _as_frames(frames, "EllipsoidSphericity")
+        n_points = frames.shape[1]
+        if n_points < 2:
+            return [ContractionExpansionResult(sphericity=0.0) for _ in range(len(frames))]
+
+        centered = frames - frames.mean(axis=1, keepdims=True)
+        scatter = np.einsum("tni,tnj->tij", centered, centered)
+        radii = np.sqrt(np.abs(np.linalg.eigvalsh(scatter)) / (n_points - 1))
+
+        # Ascending eigenvalues: the minor radius comes first, the major last
+        major = radii[:, -1]
+        safe_major = np.where(major < self.EPSILON, 1.0, major)
+        sphericity = np.where(major < self.EPSILON, 0.0, radii[:, 0] / safe_major)
+
+        return [ContractionExpansionResult(sphericity=value) for value in sphericity.tolist()]
+
 
 class PointsDensity(StaticFeature):
     r"""Computes the Points Density (Dispersion) for a sequence of skeletal frames.
@@ -201,7 +633,36 @@ class PointsDensity(StaticFeature):
         if len(frame_data) == 0:
             return ContractionExpansionResult(points_density=0.0)
 
-        barycenter = np.mean(frame_data, axis=0)
-        distances = np.linalg.norm(frame_data - barycenter, axis=1)
+        if NUMBA_AVAILABLE:
+            return ContractionExpansionResult(points_density=float(_points_density_kernel(frame_data)))
+
+        diff = frame_data - np.mean(frame_data, axis=0)
+        # Squared distances in one fused reduction, without norm's temporaries
+        distances = np.sqrt(np.einsum("ij,ij->i", diff, diff))
 
         return ContractionExpansionResult(points_density=float(distances.mean()))
+
+    def compute_batch(self, frames: np.ndarray) -> List[ContractionExpansionResult]:
+        """Compute the Points Density for every frame of a window.
+
+        Barycenters and distances of all frames are computed in single
+        vectorized operations over the `(Time, N_points, 3)` tensor.
+
+        Parameters
+        ----------
+        frames : numpy.ndarray of shape (Time, N_points, 3)
+            One frame of points per time step.
+
+        Returns
+        -------
+        list of ContractionExpansionResult
+            One result per frame, in the same order.
+        """
+        frames = _as_frames(frames, "PointsDensity")
+        if frames.shape[1] == 0:
+            return [ContractionExpansionResult(points_density=0.0) for _ in range(len(frames))]
+
+        diff = frames - frames.mean(axis=1, keepdims=True)
+        densities = np.sqrt(np.einsum("tij,tij->ti", diff, diff)).mean(axis=1)
+
+        return [ContractionExpansionResult(points_density=density) for density in densities.tolist()]
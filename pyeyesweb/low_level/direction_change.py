@@ -1,12 +1,87 @@
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, List, Optional
 import numpy as np
 
 from pyeyesweb.data_models.base import DynamicFeature
 from pyeyesweb.data_models.results import FeatureResult
+from pyeyesweb.utils.jit import NUMBA_AVAILABLE, njit
 from pyeyesweb.utils.validators import validate_string
 
 
+def _cosine_gate(epsilon):
+    """Return the bound `g` such that the cosine score is nonzero only if `|cos(theta)| < g`.
+
+    The score needs `|0.5 - theta / pi| < epsilon`. Since `arccos` is
+    decreasing, for `epsilon <= 0.5` this is `|cos(theta)| < sin(pi * epsilon)`;
+    a larger `epsilon` accepts every angle.
+    """
+    return math.sin(math.pi * epsilon) if epsilon <= 0.5 else 2.0
+
+
+@njit(cache=True)
+def _cosine_kernel(pos, epsilon, cos_gate):
+    """Cosine direction-change score of the start, mid and end points of `pos`.
+
+    `cos_gate` is `_cosine_gate(epsilon)`; angles it rejects score 0
+    without evaluating `acos`.
+    """
+    n_samples = pos.shape[0]
+    mid = n_samples // 2
+    dot = 0.0
+    sq0 = 0.0
+    sq1 = 0.0
+    for k in range(pos.shape[1]):
+        l0 = pos[n_samples - 1, k] - pos[mid, k]
+        l1 = pos[mid, k] - pos[0, k]
+        dot += l0 * l1
+        sq0 += l0 * l0
+        sq1 += l1 * l1
+    norm0 = math.sqrt(sq0)
+    norm1 = math.sqrt(sq1)
+
+    if norm0 < 1e-6 or norm1 < 1e-6:
+        return 0.0
+
+    cos_theta = min(max(dot / (norm0 * norm1), -1.0), 1.0)
+    if not abs(cos_theta) < cos_gate:
+        return 0.0
+    diff = abs(0.5 - math.acos(cos_theta) / math.pi)
+
+    if diff < epsilon:
+        return 1.0 - diff / epsilon
+    return 0.0
+
+
+@njit(cache=True)
+def _polygon_area_kernel(pos, indices):
+    """Area of the closed polygon through `pos[indices]`, for 2D or 3D points."""
+    n = indices.shape[0]
+    ax = 0.0
+    ay = 0.0
+    az = 0.0
+    for i in range(n):
+        p = pos[indices[i]]
+        q = pos[indices[(i + 1) % n]]
+        if pos.shape[1] == 2:
+            az += p[0] * q[1] - p[1] * q[0]
+        else:
+            ax += p[1] * q[2] - p[2] * q[1]
+            ay += p[2] * q[0] - p[0] * q[2]
+            az += p[0] * q[1] - p[1] * q[0]
+    return 0.5 * math.sqrt(ax * ax + ay * ay + az * az)
+
+
+@lru_cache(maxsize=32)
+def _subsample_indices(num_points: int, num_subsamples: int) -> np.ndarray:
+    """Evenly spaced trajectory indices used for the polygon, cached per window length."""
+    indices = np.linspace(0, num_points - 1, min(num_subsamples, num_points))
+    indices = np.round(indices).astype(np.intp)
+    indices.flags.writeable = False
+    return indices
+
+
 @dataclass(slots=True)
 class DirectionChangeResult(FeatureResult):
     """Output contract for Direction Change.
@@ -49,7 +124,7 @@ class DirectionChange(DynamicFeature):
             metrics: List[Literal["cosine", "polygon"]] = None
     ):
         super().__init__()
-        self._epsilon = float(epsilon)
+        self.epsilon = epsilon
         self._num_subsamples = int(num_subsamples)
         self._metrics = metrics if metrics is not None else self._ALLOWED_METRICS
 
@@ -60,6 +135,7 @@ class DirectionChange(DynamicFeature):
     @epsilon.setter
     def epsilon(self, value: float):
         self._epsilon = float(value)
+        self._cos_gate = _cosine_gate(self._epsilon)
 
     @property
     def num_subsamples(self) -> int:
@@ -86,6 +162,9 @@ class DirectionChange(DynamicFeature):
         if n_samples < 3:
             raise ValueError("Not enough samples")
 
+        if NUMBA_AVAILABLE:
+            return float(_cosine_kernel(pos, self.epsilon, self._cos_gate))
+
         # Extract Start, Mid, and End points of the trajectory
         p0 = pos[-1]
         p1 = pos[n_samples // 2]
@@ -94,19 +173,24 @@ class DirectionChange(DynamicFeature):
         L0 = p0 - p1
         L1 = p1 - p2
 
-        norm0 = np.linalg.norm(L0)
-        norm1 = np.linalg.norm(L1)
+        # The vectors have 2-3 components, so plain float arithmetic is
+        # cheaper than np.linalg.norm/np.clip/np.arccos dispatch
+        norm0 = math.sqrt(float(L0 @ L0))
+        norm1 = math.sqrt(float(L1 @ L1))
 
         if norm0 < 1e-6 or norm1 < 1e-6:
             return 0.0
 
-        dot = np.dot(L0, L1)
-        cos_theta = np.clip(dot / (norm0 * norm1), -1.0, 1.0)
-        theta = np.arccos(cos_theta)
+        dot = float(L0 @ L1)
+        cos_theta = max(-1.0, min(1.0, dot / (norm0 * norm1)))
+        # Angles too far from perpendicular score 0; skip the acos for them
+        if not abs(cos_theta) < self._cos_gate:
+            return 0.0
+        theta = math.acos(cos_theta)
 
-        angle_norm = theta / np.pi
+        angle_norm = theta / math.pi
         a = 1.0 - angle_norm
-        diff = np.abs(a - 0.5)
+        diff = abs(a - 0.5)
 
         if diff < self.epsilon:
             return float(1.0 - diff / self.epsilon)
@@ -119,15 +203,22 @@ class DirectionChange(DynamicFeature):
             raise ValueError("Not enough samples")
 
         # Subsample the trajectory securely
-        indices = np.linspace(0, num_points - 1, min(self.num_subsamples, num_points))
-        subset = pos[np.round(indices).astype(int)]
-
-        # Close the loop
-        closed_polygon = np.vstack([subset, subset[0]])
-
-        # Shoelace-style cross product area computation
-        cross_products = np.cross(closed_polygon[:-1], closed_polygon[1:])
-        area_vector = np.sum(cross_products, axis=0) / 2.0
+        indices = _subsample_indices(num_points, self.num_subsamples)
+
+        if NUMBA_AVAILABLE and pos.shape[-1] in (2, 3):
+            return float(_polygon_area_kernel(pos, indices))
+
+        subset = pos[indices]
+
+        # Shoelace-style cross product area computation; the closing edge
+        # from the last point back to the first is added separately rather
+        # than stacking a copy of the first point onto the polygon.
+        if subset.shape[-1] == 2:
+            # Only the z-component exists; np.cross on 2D vectors is deprecated
+            x, y = subset[:, 0], subset[:, 1]
+            area_vector = (np.dot(x[:-1], y[1:]) - np.dot(y[:-1], x[1:]) + x[-1] * y[0] - y[-1] * x[0]) / 2.0
+        else:
+            area_vector = (np.cross(subset[:-1], subset[1:]).sum(axis=0) + np.cross(subset[-1], subset[0])) / 2.0
 
         # Handle both 2D (scalar return) and 3D (vector return) area magnitudes
         area = np.linalg.norm(area_vector) if np.ndim(area_vector) > 0 else np.abs(area_vector)
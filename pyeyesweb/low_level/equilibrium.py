@@ -5,6 +5,7 @@ relationship between two support points (e.g. feet) and a barycenter to
 estimate the stability of a movement.
 """
 
+import math
 from dataclasses import dataclass
 import numpy as np
 
@@ -174,11 +175,11 @@ class Equilibrium(StaticFeature):
         b = self.margin * self.y_weight
 
         # 4. Rotation Matrix (Aligning relative barycenter to the feet vector)
-        angle = np.arctan2(delta[1], delta[0])
+        angle = math.atan2(delta[1], delta[0])
         rel = p_barycenter - center
 
         # Pre-calculated trig values for speed
-        cos_a, sin_a = np.cos(-angle), np.sin(-angle)
+        cos_a, sin_a = math.cos(-angle), math.sin(-angle)
         rot_matrix = np.array([
             [cos_a, -sin_a],
             [sin_a, cos_a]
@@ -194,17 +195,17 @@ class Equilibrium(StaticFeature):
         elif a < self.EPSILON:
             if abs(rel_rot[0]) <= self.EPSILON:
                 norm_y = (rel_rot[1] / b) ** 2
-                value = 1.0 - np.sqrt(norm_y) if norm_y <= 1.0 else 0.0
+                value = 1.0 - math.sqrt(norm_y) if norm_y <= 1.0 else 0.0
         elif b < self.EPSILON:
             if abs(rel_rot[1]) <= self.EPSILON:
                 norm_x = (rel_rot[0] / a) ** 2
-                value = 1.0 - np.sqrt(norm_x) if norm_x <= 1.0 else 0.0
+                value = 1.0 - math.sqrt(norm_x) if norm_x <= 1.0 else 0.0
         else:
             norm = (rel_rot[0] / a) ** 2 + (rel_rot[1] / b) ** 2
             if norm <= 1.0:
-                value = 1.0 - np.sqrt(norm)
+                value = 1.0 - math.sqrt(norm)
 
         return EquilibriumResult(
             value=float(max(0.0, value)),
-            angle=float(np.degrees(angle))
+            angle=math.degrees(angle)
         )
\ No newline at end of file
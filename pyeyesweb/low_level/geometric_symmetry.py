@@ -54,11 +54,18 @@ class GeometricSymmetry(StaticFeature): # Changed to StaticFeature!
     def __init__(self, joint_pairs: List[Tuple[int, int]], center_of_symmetry: Optional[int] = None):
         super().__init__()
         self._center_idx = center_of_symmetry if center_of_symmetry is not None else -1
-        self._signal_pairs = set(validate_pairs(joint_pairs))
+        # Deduplicated, in the order given, so results follow the input order
+        self._signal_pairs = list(dict.fromkeys(validate_pairs(joint_pairs)))
 
         if not self._signal_pairs:
             raise ValueError("At least one signal pair must be provided.")
 
+        # Structure-of-arrays view of the pairs, so all pairs are gathered and
+        # scored in one pass, plus their precomputed result keys
+        self._left_idx = np.array([left for left, _ in self._signal_pairs], dtype=np.intp)
+        self._right_idx = np.array([right for _, right in self._signal_pairs], dtype=np.intp)
+        self._pair_keys = [f"{left}_{right}" for left, right in self._signal_pairs]
+
         self._max_required_idx = max(max(pair) for pair in self._signal_pairs)
         if self._center_idx != -1:
             self._max_required_idx = max(self._max_required_idx, self._center_idx)
@@ -95,26 +102,24 @@ class GeometricSymmetry(StaticFeature): # Changed to StaticFeature!
         # 3. Center the data
         centered_data = frame_data - cos
 
-        # 4. Compute Symmetry Error Frame-by-Frame
-        pair_errors = {}
-        for left_idx, right_idx in self._signal_pairs:
-            left_joint = centered_data[left_idx, :]   # Shape: (3,)
-            right_joint = centered_data[right_idx, :] # Shape: (3,)
-
-            # Reflect the right joint across the X-axis
-            reflected_right = right_joint.copy()
-            reflected_right[0] = -reflected_right[0]
-
-            # Calculate instantaneous Euclidean distance
-            error = np.linalg.norm(left_joint - reflected_right)
-
-            # Scale-invariant normalization via Triangle Inequality:
-            # max possible distance between L and R' is ||L|| + ||R'|| = ||L|| + ||R||
-            norm_l = np.linalg.norm(left_joint)
-            norm_r = np.linalg.norm(right_joint)
-            normalized_error = error / (norm_l + norm_r + self.EPSILON)
-
-            pair_key = f"{left_idx}_{right_idx}"
-            pair_errors[pair_key] = float(max(0.0, 1.0 - normalized_error))
+        # 4. Compute Symmetry Error for all pairs at once
+        left_joints = centered_data[self._left_idx]    # Shape: (P, 3)
+        right_joints = centered_data[self._right_idx]  # Shape: (P, 3)
+
+        # Distance to the right joint reflected across the X-axis: the
+        # reflection only flips the sign of x, so fold it into the
+        # difference instead of copying the joints.
+        diff = left_joints - right_joints
+        diff[:, 0] = left_joints[:, 0] + right_joints[:, 0]
+        error = np.sqrt(np.einsum('pi,pi->p', diff, diff))
+
+        # Scale-invariant normalization via Triangle Inequality:
+        # max possible distance between L and R' is ||L|| + ||R'|| = ||L|| + ||R||
+        norm_l = np.sqrt(np.einsum('pi,pi->p', left_joints, left_joints))
+        norm_r = np.sqrt(np.einsum('pi,pi->p', right_joints, right_joints))
+        normalized_error = error / (norm_l + norm_r + self.EPSILON)
+        scores = np.maximum(0.0, 1.0 - normalized_error)
+
+        pair_errors = dict(zip(self._pair_keys, scores.tolist()))
 
         return GeometricSymmetryResult(is_valid=True, pairs=pair_errors)
\ No newline at end of file
@@ -4,6 +4,7 @@ import numpy as np
 
 from pyeyesweb.data_models.base import StaticFeature
 from pyeyesweb.data_models.results import FeatureResult
+from pyeyesweb.utils.validators import validate_boolean
 
 
 @dataclass(slots=True)
@@ -78,16 +79,23 @@ class KineticEnergy(StaticFeature):
         joints or an array of shape `(N_signals,)`. Defaults to `1.0`.
     labels : list of str, optional
         Text labels for each signal, used in the `joints` output dictionary.
+    joint_details : bool, optional
+        Whether to build the per-joint `joints` dictionary. Consumers that
+        only need the total and per-axis energies can disable it to skip one
+        dictionary per joint on every frame, in which case `joints` is
+        `None`. Defaults to `True`.
     """
 
     def __init__(
             self,
             weights: Union[float, List[float], np.ndarray] = 1.0,
-            labels: List[str] = None
+            labels: List[str] = None,
+            joint_details: bool = True
     ):
         super().__init__()
         self.labels = labels
         self.weights = weights
+        self.joint_details = joint_details
 
     @property
     def weights(self) -> Union[float, np.ndarray]:
@@ -97,6 +105,14 @@ class KineticEnergy(StaticFeature):
     def weights(self, value: Union[float, List[float], np.ndarray]):
         self._weights = self._parse_weights(value)
 
+    @property
+    def joint_details(self) -> bool:
+        return self._joint_details
+
+    @joint_details.setter
+    def joint_details(self, value: bool):
+        self._joint_details = validate_boolean(value, "joint_details")
+
     @property
     def labels(self) -> Optional[List[str]]:
         return self._labels
@@ -131,7 +147,10 @@ class KineticEnergy(StaticFeature):
         KineticEnergyResult
             The computed energy values.
         """
-        velocities = np.asarray(frame_data, dtype=float)
+        # Single-precision windows stay in float32; anything else is promoted
+        velocities = np.asarray(frame_data)
+        if velocities.dtype != np.float32:
+            velocities = velocities.astype(np.float64, copy=False)
 
         if velocities.ndim == 1:
             velocities = velocities.reshape(1, -1)
@@ -152,12 +171,14 @@ class KineticEnergy(StaticFeature):
         kinetic_energy_per_joint = kinetic_energy_components.sum(axis=1)
 
         # 3. Aggregation and Dictionary Building
-        joint_energy_dict = {}
-        for i in range(num_joints):
-            key = self.labels[i] if self.labels else str(i)
-            joint_energy_dict[key] = {
-                "total": float(kinetic_energy_per_joint[i]),
-                "components": kinetic_energy_components[i].tolist()
+        joint_energy_dict = None
+        if self._joint_details:
+            keys = self.labels if self.labels else [str(i) for i in range(num_joints)]
+            joint_energy_dict = {
+                key: {"total": total, "components": components}
+                for key, total, components in zip(
+                    keys, kinetic_energy_per_joint.tolist(), kinetic_energy_components.tolist()
+                )
             }
 
         return KineticEnergyResult(
@@ -5,7 +5,12 @@ import numpy as np
 from pyeyesweb.data_models.base import DynamicFeature
 from pyeyesweb.data_models.results import FeatureResult
 from pyeyesweb.utils.signal_processing import apply_savgol_filter
-from pyeyesweb.utils.math_utils import compute_sparc, compute_jerk_rms
+from pyeyesweb.utils.math_utils import (
+    compute_sparc,
+    compute_sparc_batch,
+    compute_jerk_rms,
+    extract_velocity_from_position,
+)
 from pyeyesweb.utils.validators import validate_numeric, validate_boolean, validate_string
 
 
@@ -170,4 +175,83 @@ class Smoothness(DynamicFeature):
             # Standard Jerk RMS calculation from velocity
             jerk_val = float(compute_jerk_rms(filtered_speed, self.rate_hz, signal_type='velocity'))
 
-        return SmoothnessResult(sparc=sparc_val, jerk_rms=jerk_val)
\ No newline at end of file
+        return SmoothnessResult(sparc=sparc_val, jerk_rms=jerk_val)
+
+    def compute_from_positions(
+            self,
+            positions: np.ndarray,
+            timestamps: Optional[np.ndarray] = None
+    ) -> SmoothnessResult:
+        """Executes smoothness calculation on a window of raw positions.
+
+        The speed profile is derived from the whole window in one vectorized
+        step, so callers do not need to compute per-frame `dx`, `dy` and `dt`
+        in Python before appending a speed sample.
+
+        Parameters
+        ----------
+        positions : numpy.ndarray of shape (Time,) or (Time, Dims)
+            Positions of a single point, e.g. the `(x, y)` columns of a
+            [SlidingWindow][pyeyesweb.data_models.sliding_window.SlidingWindow]
+            from `to_flat_array()`.
+        timestamps : numpy.ndarray of shape (Time,), optional
+            Sample times in seconds. If `None`, samples are assumed to be
+            evenly spaced at `rate_hz`.
+
+        Returns
+        -------
+        SmoothnessResult
+            The computed smoothness metrics.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim > 2:
+            raise ValueError("Smoothness.compute_from_positions expects a 1D or 2D array of shape (Time, Dims).")
+
+        speed_profile = extract_velocity_from_position(positions, rate_hz=self.rate_hz, timestamps=timestamps)
+        return self.compute(speed_profile)
+
+    def compute_batch(self, signals: np.ndarray) -> List[SmoothnessResult]:
+        """Executes smoothness calculation on several speed profiles at once.
+
+        Filtering, the SPARC spectra and the jerk derivatives are computed
+        for all profiles in single vectorized calls, which is cheaper than
+        calling `compute` once per profile (e.g. one per tracked joint).
+
+        Parameters
+        ----------
+        signals : numpy.ndarray of shape (N_profiles, Time)
+            One speed profile per row.
+
+        Returns
+        -------
+        list of SmoothnessResult
+            One result per row, in the same order.
+        """
+        signals = np.asarray(signals, dtype=np.float64)
+        if signals.ndim != 2:
+            raise ValueError("Smoothness.compute_batch expects a 2D array of shape (N_profiles, Time).")
+
+        n_profiles, n_samples = signals.shape
+
+        # Minimum sample threshold for FFT
+        if n_samples < 10:
+            return [SmoothnessResult(is_valid=False) for _ in range(n_profiles)]
+
+        filtered_speed = self._filter_signal(signals)
+
+        sparc_vals = [None] * n_profiles
+        jerk_vals = [None] * n_profiles
+
+        if "sparc" in self.metrics:
+            sparc_vals = compute_sparc_batch(
+                filtered_speed,
+                rate_hz=self.rate_hz,
+                amplitude_threshold=self.sparc_threshold,
+                min_fc=self.sparc_min_fc,
+                max_fc=self.sparc_max_fc
+            ).tolist()
+
+        if "jerk_rms" in self.metrics:
+            jerk_vals = compute_jerk_rms(filtered_speed, self.rate_hz, signal_type='velocity').tolist()
+
+        return [SmoothnessResult(sparc=sparc, jerk_rms=jerk) for sparc, jerk in zip(sparc_vals, jerk_vals)]
@@ -5,6 +5,7 @@ import numpy as np
 
 from pyeyesweb.data_models.base import DynamicFeature
 from pyeyesweb.data_models.results import FeatureResult
+from pyeyesweb.data_models.sliding_window import SlidingWindow
 from pyeyesweb.low_level.kinetic_energy import KineticEnergy
 from pyeyesweb.analysis_primitives.rarity import Rarity
 
@@ -27,6 +28,11 @@ class LightnessResult(FeatureResult):
 class Lightness(DynamicFeature):
     """Computes Lightness by evaluating the rarity of the Vertical Kinetic Energy weight index over a time window.
 
+    When streaming over a `SlidingWindow`, the weight index of each frame is
+    computed once, when the frame is appended, and kept in a ring aligned
+    with the window instead of being recomputed for the whole window on
+    every call.
+
     Read more in the [User Guide](../../user_guide/theoretical_framework/mid_level/lightness.md).
 
     Parameters
@@ -38,11 +44,17 @@ class Lightness(DynamicFeature):
     def __init__(self, alpha: float = 0.5):
         super().__init__()
         # Instantiate sub-features
-        self._kinetic_energy = KineticEnergy()
+        # Only the total and per-axis energies are used
+        self._kinetic_energy = KineticEnergy(joint_details=False)
         self._rarity = Rarity()
 
         self.alpha = alpha
 
+        # Per-frame weight indices, bound to one SlidingWindow
+        self._window = None
+        self._version = None
+        self._weight_ring = None
+
     @property
     def alpha(self) -> float:
         return self._rarity.alpha
@@ -51,6 +63,80 @@ class Lightness(DynamicFeature):
     def alpha(self, value: float):
         self._rarity.alpha = value
 
+    def _weight_indices(self, window_data: np.ndarray) -> np.ndarray:
+        """Return the vertical share of kinetic energy of every frame.
+
+        Vectorized over the `(Time, N_signals, N_dims)` tensor; equivalent to
+        running `KineticEnergy.compute` frame by frame and dividing the
+        vertical (Y, index 1) component by the total. Frames with zero
+        energy get a weight index of 0.
+        """
+        velocities = np.asarray(window_data)
+        components = 0.5 * self._kinetic_energy.weights * velocities ** 2
+        total_energy = components.sum(axis=(1, 2), dtype=np.float64)
+        vertical_energy = components[..., 1].sum(axis=1, dtype=np.float64)
+        return np.where(total_energy == 0, 0.0, vertical_energy / (total_energy + 1e-9))
+
+    def _from_weight_indices(self, weight_indices: np.ndarray) -> LightnessResult:
+        """Compute lightness from the chronological weight indices of a window."""
+        # Invert the weight index (as per original logic)
+        inverted_weights = 1.0 - weight_indices
+
+        # Compute Rarity over the 1D inverted weight index array
+        rarity_res = self._rarity.compute(inverted_weights)
+
+        if not rarity_res.is_valid:
+            return LightnessResult(is_valid=False)
+
+        return LightnessResult(
+            lightness=float(rarity_res.rarity),
+            latest_weight_index=float(weight_indices[-1])
+        )
+
+    def __call__(self, data: SlidingWindow) -> LightnessResult:
+        """Compute lightness for the window, reusing the weight indices of earlier frames.
+
+        Parameters
+        ----------
+        data : SlidingWindow
+            Circular buffer of velocities of shape `(Time, N_signals, N_dims)`.
+
+        Returns
+        -------
+        LightnessResult
+            Same result as `compute` on the window contents.
+        """
+        new = None
+        if data is self._window:
+            new, _, version = data.appended_since(self._version)
+        if new is None:
+            # First call, or the window was reset or resized, or too many
+            # samples arrived since the last call: start over
+            new, _, version = data.appended_since()
+            self._window = data
+            self._weight_ring = np.empty(data.max_length)
+
+        # Weight index of sample k lives in slot k % max_length, as in the window
+        capacity = data.max_length
+        write_pos = version[1]
+        n_new = new.shape[0]
+        if n_new > 0:
+            slots = (write_pos - n_new + np.arange(n_new)) % capacity
+            self._weight_ring[slots] = self._weight_indices(new)
+        self._version = version
+
+        n_frames = min(write_pos, capacity)
+        if n_frames < 2:
+            return LightnessResult(is_valid=False)
+
+        start = (write_pos - n_frames) % capacity
+        end = start + n_frames
+        if end <= capacity:
+            weight_indices = self._weight_ring[start:end]
+        else:
+            weight_indices = np.concatenate((self._weight_ring[start:], self._weight_ring[:end - capacity]))
+        return self._from_weight_indices(weight_indices)
+
     def compute(self, window_data: np.ndarray, **kwargs) -> LightnessResult:
         """The Pure Math API for computing lightness.
 
@@ -70,36 +156,6 @@ class Lightness(DynamicFeature):
         if n_frames < 2:
             return LightnessResult(is_valid=False)
 
-        weight_indices = np.zeros(n_frames)
-
-        # 1. Compute Kinetic Energy weight index for every frame in the window
-        for i in range(n_frames):
-            frame_vel = window_data[i]
-
-            # KineticEnergy is a StaticFeature, so it expects a single frame (N_signals, N_dims)
-            # We call the public compute method!
-            ke_res = self._kinetic_energy.compute(frame_vel)
-
-            if not ke_res.is_valid or ke_res.total_energy == 0:
-                weight_indices[i] = 0.0
-                continue
-
-            # Vertical component is typically index 1 (Y) or 2 (Z) depending on coordinate system.
-            # Assuming Y is vertical based on the original code `component_energy[1]`
-            vertical_energy = ke_res.component_energy[1]
-            weight_indices[i] = vertical_energy / (ke_res.total_energy + 1e-9)
-
-        # Invert the weight index (as per original logic)
-        inverted_weights = 1.0 - weight_indices
-
-        # 2. Compute Rarity over the computed 1D weight index array
-        # We call the public compute method!
-        rarity_res = self._rarity.compute(inverted_weights)
-
-        if not rarity_res.is_valid:
-            return LightnessResult(is_valid=False)
-
-        return LightnessResult(
-            lightness=float(rarity_res.rarity),
-            latest_weight_index=float(weight_indices[-1])
-        )
\ No newline at end of file
+        # Vertical component is typically index 1 (Y) or 2 (Z) depending on coordinate system.
+        # Assuming Y is vertical based on the original code `component_energy[1]`
+        return self._from_weight_indices(self._weight_indices(window_data))
@@ -1,12 +1,52 @@
 """Suddenness evaluation based on velocity distribution."""
 
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
 
 from pyeyesweb.data_models.base import DynamicFeature
 from pyeyesweb.data_models.results import FeatureResult
 
 
+# Percentiles used by the quantile fit of the stable distribution
+_FIT_PERCENTILES = (95, 75, 50, 25, 5)
+
+
+@lru_cache(maxsize=32)
+def _midpoint_ranks(n_samples):
+    """Return the ranks bracketing each of `_FIT_PERCENTILES` for `n_samples` values.
+
+    Gives `(lower, upper, kth)`: the floor and ceil of each percentile's
+    fractional rank, and every rank `np.partition` has to place, including
+    the last one so NaNs can be detected.
+    """
+    positions = (n_samples - 1) * np.array(_FIT_PERCENTILES) / 100.0
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    kth = np.unique(np.concatenate((lower, upper, [n_samples - 1])))
+    for array in (lower, upper, kth):
+        array.setflags(write=False)
+    return lower, upper, kth
+
+
+def _midpoint_percentiles(data):
+    """Return `np.percentile(data, _FIT_PERCENTILES, method='midpoint')` as float64.
+
+    Only the bracketing ranks are placed with one `np.partition`, which
+    skips `np.percentile`'s generic dispatch on these short windows. The
+    midpoints are averaged in float64: identical to NumPy for float64
+    data, and exact for float32 data, where NumPy rounds the bracketing
+    difference to float32 and may differ in the last float32 bit.
+    """
+    lower, upper, kth = _midpoint_ranks(len(data))
+    partitioned = np.partition(data, kth)
+    if np.isnan(partitioned[-1]):
+        # NaNs are partitioned last; np.percentile propagates them
+        return np.full(len(_FIT_PERCENTILES), np.nan)
+    return 0.5 * (partitioned[lower].astype(np.float64) + partitioned[upper])
+
+
 @dataclass(slots=True)
 class SuddennessResult(FeatureResult):
     """Output contract for Suddenness evaluation.
@@ -66,6 +106,14 @@ class Suddenness(DynamicFeature):
     _a_vals = np.array([2.439, 2.5, 2.6, 2.7, 2.8, 3, 3.2, 3.5, 4, 5, 6, 8, 10, 15, 25])
     _b_vals = np.array([0.0, 0.1, 0.2, 0.3, 0.5, 0.7, 1.0])
 
+    # Plain-float copies of the grids; bisecting a tuple avoids NumPy's
+    # per-call overhead on these tiny scalar lookups
+    _a_grid = tuple(_a_vals.tolist())
+    _b_grid = tuple(_b_vals.tolist())
+    # Reciprocal cell widths, so interpolation multiplies instead of dividing
+    _inv_da = tuple((1.0 / np.diff(_a_vals)).tolist())
+    _inv_db = tuple((1.0 / np.diff(_b_vals)).tolist())
+
     def __init__(self, algo: str = "new"):
         super().__init__()
         self.algo = algo
@@ -101,9 +149,10 @@ class Suddenness(DynamicFeature):
         if n_samples < 2:
             return SuddennessResult(is_valid=False)
 
-        # Calculate velocities (magnitude of difference)
+        # Calculate velocities (magnitude of difference) in one pass over
+        # the trajectory; einsum avoids norm's squared temporary
         diffs = pos[1:] - pos[:-1]
-        velocities = np.linalg.norm(diffs, axis=1)
+        velocities = np.sqrt(np.einsum("ij,ij->i", diffs, diffs))
 
         if len(velocities) < 5:
             return SuddennessResult(is_valid=False)
@@ -123,30 +172,25 @@ class Suddenness(DynamicFeature):
         )
 
     def _interp2d(self, tab, nu_alpha, nu_beta):
-        rows, cols = tab.shape
-        a = self._a_vals
-        b = self._b_vals
+        a = self._a_grid
+        b = self._b_grid
 
         row, col = -1, -1
 
-        # Find the column index
-        for i in range(1, cols):
-            if a[i - 1] <= nu_alpha <= a[i]:
-                col = i - 1
-                break
-
-        # Find the row index
-        for i in range(1, rows):
-            if b[i - 1] <= nu_beta <= b[i]:
-                row = i - 1
-                break
+        # The grids are sorted, so the bracketing cell is found by bisection;
+        # a value on a grid point belongs to the cell on its left, and values
+        # outside the grid (or NaN) leave the index at -1
+        if a[0] <= nu_alpha <= a[-1]:
+            col = max(bisect_left(a, nu_alpha), 1) - 1
+        if b[0] <= nu_beta <= b[-1]:
+            row = max(bisect_left(b, nu_beta), 1) - 1
 
         if row != -1 and col != -1:
-            relcol = abs(a[col] - nu_alpha) / abs(a[col] - a[col + 1])
+            relcol = (nu_alpha - a[col]) * self._inv_da[col]
             mean1 = tab[row, col] + (tab[row, col + 1] - tab[row, col]) * relcol
             mean2 = tab[row + 1, col] + (tab[row + 1, col + 1] - tab[row + 1, col]) * relcol
 
-            relrow = abs(b[row] - nu_beta) / abs(b[row] - b[row + 1])
+            relrow = (nu_beta - b[row]) * self._inv_db[row]
             result = mean1 + (mean2 - mean1) * relrow
             return result
 
@@ -158,9 +202,9 @@ class Suddenness(DynamicFeature):
             return 2.0, 0.0, 0.0, 0.0  # Return Gaussian (Normal) defaults
 
         # 2. Compute percentiles
-        percentiles = [95, 75, 50, 25, 5]
-        # using 'midpoint' interpolation is safer for small windows than default 'linear'
-        x_percentiles = np.percentile(np.sort(data), percentiles, method='midpoint')
+        # using 'midpoint' interpolation is safer for small windows than default 'linear';
+        # the data is partitioned around the needed ranks instead of fully sorted
+        x_percentiles = _midpoint_percentiles(data)
 
         x95, x75, x50, x25, x5 = x_percentiles
 
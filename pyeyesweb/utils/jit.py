@@ -0,0 +1,25 @@
+"""Optional Numba acceleration for PyEyesWeb.
+
+Numba is an optional dependency (`pip install pyeyesweb[jit]`). When it is
+installed, numeric kernels decorated with [njit][pyeyesweb.utils.jit.njit]
+are compiled to machine code. When it is not, the decorator is a no-op and
+callers branch on `NUMBA_AVAILABLE` to use their NumPy implementation instead.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for `numba.njit` when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
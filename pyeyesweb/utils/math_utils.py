@@ -4,10 +4,78 @@ This module provides mathematical functions used throughout the PyEyesWeb
 library for signal processing, phase analysis, and movement metrics.
 """
 
+from functools import lru_cache
+
 import numpy as np
-from scipy.fft import fft, fftfreq
+from scipy.fft import rfft, rfftfreq
+from pyeyesweb.utils.jit import NUMBA_AVAILABLE, njit
 from pyeyesweb.utils.validators import validate_numeric
 
+
+@njit(cache=True, fastmath=True)
+def _arc_length_kernel(xf, yf, fc):
+    """Fused `sum(sqrt((diff(xf) / fc)**2 + diff(yf)**2))` in a single pass."""
+    acc = 0.0
+    for i in range(1, xf.shape[0]):
+        dx = (xf[i] - xf[i - 1]) / fc
+        dy = yf[i] - yf[i - 1]
+        acc += np.sqrt(dx * dx + dy * dy)
+    return acc
+
+
+@njit(cache=True)
+def _sparc_spectrum_kernel(yf, xf, amplitude_threshold, min_fc, max_fc):
+    """SPARC arc length from a magnitude spectrum, or NaN; normalizes `yf` in place.
+
+    Fuses the amplitude normalization, the cut-off search and the
+    `[0, fc]` selection of `compute_sparc` into compiled loops.
+    """
+    n_bins = yf.shape[0]
+    max_yf = 0.0
+    for i in range(n_bins):
+        if yf[i] > max_yf:
+            max_yf = yf[i]
+    if not max_yf > 0:
+        return np.nan
+    for i in range(n_bins):
+        yf[i] /= max_yf
+
+    # Last bin at or above the threshold sets the estimated cut-off
+    fc = min_fc
+    for i in range(n_bins - 1, -1, -1):
+        if yf[i] >= amplitude_threshold:
+            fc = xf[i]
+            break
+    fc = max(min_fc, min(max_fc, fc))
+
+    # xf is increasing, so the [0, fc] selection is a prefix
+    n_selected = np.searchsorted(xf, fc, side='right')
+    if n_selected < 2:
+        return np.nan
+    return _arc_length_kernel(xf[:n_selected], yf[:n_selected], fc)
+
+
+@njit(cache=True, fastmath=True)
+def _gradient_rms_kernel(signal, dt, n_derivatives):
+    """Apply `np.gradient` `n_derivatives` times and return the RMS, without temporaries."""
+    n = signal.shape[0]
+    src = signal.copy()
+    dst = np.empty(n)
+    inv_dt = 1.0 / dt
+    half_inv_dt = 0.5 * inv_dt
+    for _ in range(n_derivatives):
+        dst[0] = (src[1] - src[0]) * inv_dt
+        for i in range(1, n - 1):
+            dst[i] = (src[i + 1] - src[i - 1]) * half_inv_dt
+        dst[n - 1] = (src[n - 1] - src[n - 2]) * inv_dt
+        src, dst = dst, src
+
+    acc = 0.0
+    for i in range(n):
+        acc += src[i] * src[i]
+    return np.sqrt(acc / n)
+
+
 def compute_phase_locking_value(phase1, phase2):
     """Compute the Phase Locking Value (PLV) from two phase arrays.
 
@@ -37,6 +105,33 @@ def compute_phase_locking_value(phase1, phase2):
     return plv
 
 
+def compute_phase_locking_value_from_analytic(analytic1, analytic2):
+    """Compute the Phase Locking Value (PLV) directly from two analytic signals.
+
+    Equivalent to `compute_phase_locking_value(np.angle(analytic1), np.angle(analytic2))`,
+    since `exp(1j * (phase1 - phase2))` is the unit phasor of
+    `analytic1 * conj(analytic2)`. Working on the phasors skips the `angle` and
+    `exp` transcendental passes entirely.
+
+    Parameters
+    ----------
+    analytic1 : ndarray
+        Complex analytic signal of the first channel.
+    analytic2 : ndarray
+        Complex analytic signal of the second channel.
+
+    Returns
+    -------
+    float
+        Phase Locking Value between 0 and 1.
+    """
+    cross = analytic1 * np.conj(analytic2)
+    magnitude = np.abs(cross)
+    # A zero sample has phase 0 by convention (as np.angle), i.e. a unit phasor of 1
+    unit_phasors = np.divide(cross, magnitude, out=np.ones_like(cross), where=magnitude > 0)
+    return np.abs(unit_phasors.sum()) / unit_phasors.shape[0]
+
+
 def center_signals(sig):
     """Remove the mean from each signal to center the data.
 
@@ -54,6 +149,27 @@ def center_signals(sig):
     """
     return sig - np.mean(sig, axis=0, keepdims=True)
 
+
+def _is_constant(signals):
+    """Return `np.all(np.isclose(signals, signals[..., :1]), axis=-1)` without temporaries.
+
+    With a scalar reference per row, the largest deviation is reached at
+    the row maximum or minimum, so two reductions replace the element-wise
+    `isclose` masks. Uses `np.isclose`'s default tolerances.
+    """
+    first = signals[..., 0]
+    tol = 1e-8 + 1e-5 * np.abs(first)
+    return (signals.max(axis=-1) - first <= tol) & (first - signals.min(axis=-1) <= tol)
+
+
+@lru_cache(maxsize=32)
+def _sparc_frequency_axis(n_fft, rate_hz):
+    """Return the (read-only) positive frequency axis used by `compute_sparc`."""
+    xf = rfftfreq(n_fft, 1.0 / rate_hz)[:n_fft // 2]
+    xf.setflags(write=False)
+    return xf
+
+
 def compute_sparc(
     signal, 
     rate_hz=50.0, 
@@ -106,16 +222,22 @@ def compute_sparc(
     signal = np.asarray(signal)
     
     # Check signal validity
-    if len(signal) < 2 or np.allclose(signal, signal[0]):
+    if len(signal) < 2 or _is_constant(signal):
         return np.nan
 
     # 1. FFT and magnitude spectrum calculation
     n = len(signal)
     # Zero-padding to 1024 or next power of 2 for improved spectral resolution
-    n_fft = max(1024, int(2**np.ceil(np.log2(n))))
+    n_fft = max(1024, 1 << (n - 1).bit_length())
     
-    yf = np.abs(fft(signal, n=n_fft))[:n_fft // 2]
-    xf = fftfreq(n_fft, 1.0 / rate_hz)[:n_fft // 2]
+    # The input is real, so only the non-redundant half of the spectrum is computed
+    yf = np.abs(rfft(signal, n=n_fft))[:n_fft // 2]
+    # The frequency axis only depends on (n_fft, rate_hz), which are fixed in streaming use
+    xf = _sparc_frequency_axis(n_fft, rate_hz)
+
+    if NUMBA_AVAILABLE:
+        # Steps 2-5 below, compiled; the FFT stays in SciPy
+        return -_sparc_spectrum_kernel(yf, xf, float(amplitude_threshold), float(min_fc), float(max_fc))
 
     # 2. Amplitude normalization relative to maximum (Scale invariance)
     max_yf = np.max(yf)
@@ -137,25 +259,93 @@ def compute_sparc(
     fc = max(min_fc, min(max_fc, fc_estimated))
 
     # 4. Select data within the [0, fc] range
-    sel_idx = np.where(xf <= fc)[0]
-    xf_sel = xf[sel_idx]
-    yf_sel = yf[sel_idx]
+    # xf is increasing, so the selection is a prefix and can be taken as views
+    n_selected = np.searchsorted(xf, fc, side='right')
+    xf_sel = xf[:n_selected]
+    yf_sel = yf[:n_selected]
 
     # 5. Normalized arc length calculation
     # The frequency axis is rescaled between 0 and 1 (f / fc)
     if len(xf_sel) < 2:
         return np.nan
         
+    # Geometric arc length in the normalized spectrum
     d_xf_norm = np.diff(xf_sel) / fc
     d_yf = np.diff(yf_sel)
-    
-    # Geometric arc length in the normalized spectrum
     arc_length = np.sum(np.sqrt(d_xf_norm**2 + d_yf**2))
     
     # The result is negative by convention (values closer to 0 = smoother)
     return -arc_length
 
 
+def compute_sparc_batch(
+    signals,
+    rate_hz=50.0,
+    amplitude_threshold=0.05,
+    min_fc=2.0,
+    max_fc=20.0
+):
+    """Compute SPARC for several speed profiles at once.
+
+    Vectorized counterpart of [compute_sparc][pyeyesweb.utils.math_utils.compute_sparc]:
+    all profiles are transformed with a single batched real FFT and the
+    cut-off selection and arc length are reduced along the frequency axis,
+    so the per-call Python overhead is paid once for the whole batch.
+
+    Parameters
+    ----------
+    signals : ndarray
+        2D array of shape (n_signals, n_samples), one speed profile per row.
+    rate_hz : float
+        Sampling rate in Hz.
+    amplitude_threshold : float, optional
+        Amplitude threshold for determining the cut-off frequency fc (default: 0.05).
+    min_fc : float, optional
+        Minimum cut-off frequency in Hz (default: 2.0).
+    max_fc : float, optional
+        Maximum cut-off frequency in Hz (default: 20.0).
+
+    Returns
+    -------
+    ndarray
+        SPARC value for each row, NaN where `compute_sparc` would return NaN.
+    """
+    rate_hz = validate_numeric(rate_hz, 'rate_hz', min_val=0.0001)
+    signals = np.atleast_2d(np.asarray(signals, dtype=np.float64))
+    n_signals, n = signals.shape
+
+    result = np.full(n_signals, np.nan)
+    if n < 2:
+        return result
+
+    valid = ~_is_constant(signals)
+
+    n_fft = max(1024, 1 << (n - 1).bit_length())
+    yf = np.abs(rfft(signals, n=n_fft, axis=1, workers=-1))[:, :n_fft // 2]
+    xf = _sparc_frequency_axis(n_fft, rate_hz)
+
+    max_yf = yf.max(axis=1)
+    valid &= max_yf > 0
+    yf /= np.where(max_yf > 0, max_yf, 1.0)[:, np.newaxis]
+
+    # Last bin above threshold in each row
+    above = yf >= amplitude_threshold
+    last_above = yf.shape[1] - 1 - np.argmax(above[:, ::-1], axis=1)
+    fc_estimated = np.where(above.any(axis=1), xf[last_above], min_fc)
+    fc = np.maximum(min_fc, np.minimum(max_fc, fc_estimated))
+
+    # xf is increasing, so the [0, fc] selection is a prefix of each row
+    n_selected = np.searchsorted(xf, fc, side='right')
+    valid &= n_selected >= 2
+
+    d_xf_norm = np.diff(xf)[np.newaxis, :] / fc[:, np.newaxis]
+    segments = np.sqrt(d_xf_norm**2 + np.diff(yf, axis=1)**2)
+    segments[np.arange(segments.shape[1])[np.newaxis, :] >= (n_selected - 1)[:, np.newaxis]] = 0.0
+
+    result[valid] = -segments[valid].sum(axis=1)
+    return result
+
+
 def compute_jerk_rms(signal, rate_hz=50.0, signal_type='velocity'):
     """Compute RMS of jerk (rate of change of acceleration) from a signal.
 
@@ -164,7 +354,7 @@ def compute_jerk_rms(signal, rate_hz=50.0, signal_type='velocity'):
     Parameters
     ----------
     signal : ndarray
-        1D movement signal.
+        1D movement signal, or a 2D array with one signal per row.
     rate_hz : float, optional
         Sampling rate in Hz (default: 50.0).
     signal_type : str, optional
@@ -174,8 +364,8 @@ def compute_jerk_rms(signal, rate_hz=50.0, signal_type='velocity'):
 
     Returns
     -------
-    float
-        Root mean square of jerk.
+    float or ndarray
+        Root mean square of jerk (one value per row for 2D input).
         Returns NaN if signal has insufficient samples for the required derivatives.
 
     Notes
@@ -197,9 +387,23 @@ def compute_jerk_rms(signal, rate_hz=50.0, signal_type='velocity'):
     n_derivatives = derivative_orders[signal_type]
     min_samples = n_derivatives + 1
 
+    signal = np.asarray(signal)
+    if signal.ndim > 1:
+        # Batched input: one profile per row
+        if signal.shape[-1] < min_samples:
+            return np.full(signal.shape[:-1], np.nan)
+        result = signal
+        for _ in range(n_derivatives):
+            result = np.gradient(result, 1.0/rate_hz, axis=-1)
+        return np.sqrt(np.mean(result ** 2, axis=-1))
+
     if len(signal) < min_samples:
         return np.nan
 
+    if NUMBA_AVAILABLE:
+        signal = np.ascontiguousarray(signal, dtype=np.float64)
+        return _gradient_rms_kernel(signal, 1.0 / rate_hz, n_derivatives)
+
     # Apply derivatives using numpy.gradient for better accuracy
     result = np.asarray(signal)
     for _ in range(n_derivatives):
@@ -225,11 +429,13 @@ def normalize_signal(signal):
         Normalized signal with same shape as input.
         Returns original signal if max absolute value is 0.
     """
-    max_val = np.max(np.abs(signal))
+    signal = np.asarray(signal)
+    # max(|x|) from two reductions, without materializing np.abs(signal)
+    max_val = max(signal.max(), -signal.min())
     return signal / max_val if max_val != 0 else signal
 
 
-def extract_velocity_from_position(position, rate_hz=50.0):
+def extract_velocity_from_position(position, rate_hz=50.0, timestamps=None):
     """Extract velocity from position data.
 
     Computes velocity magnitude from position data of any dimensionality.
@@ -243,7 +449,11 @@ def extract_velocity_from_position(position, rate_hz=50.0):
         - 1D array: single position coordinate
         - 2D array with shape (n_samples, n_dims): multi-dimensional positions
     rate_hz : float, optional
-        Sampling rate in Hz (default: 50.0).
+        Sampling rate in Hz (default: 50.0). Ignored when `timestamps` is given.
+    timestamps : ndarray, optional
+        1D array of sample times in seconds, one per row of `position`.
+        When given, derivatives use the actual (possibly uneven) spacing
+        between samples instead of a fixed `1 / rate_hz`.
 
     Returns
     -------
@@ -260,8 +470,13 @@ def extract_velocity_from_position(position, rate_hz=50.0):
     >>> position_2d = np.array([[0, 0], [1, 0], [1, 1], [2, 1]])
     >>> velocity = extract_velocity_from_position(position_2d, rate_hz=100)
     """
-    rate_hz = validate_numeric(rate_hz, 'rate_hz', min_val=0.0001)
-    dt = 1.0 / rate_hz
+    if timestamps is None:
+        rate_hz = validate_numeric(rate_hz, 'rate_hz', min_val=0.0001)
+        dt = 1.0 / rate_hz
+    else:
+        dt = np.asarray(timestamps, dtype=np.float64)
+        if dt.ndim != 1 or dt.shape[0] != np.shape(position)[0]:
+            raise ValueError("timestamps must be a 1D array with one entry per position sample")
 
     position = np.asarray(position)
 
@@ -4,9 +4,12 @@ This module provides signal processing functions including filtering,
 phase extraction, and smoothing operations used throughout the library.
 """
 
+from functools import lru_cache
+
 import numpy as np
-from scipy.signal import hilbert, butter, filtfilt, savgol_filter
-from pyeyesweb.utils.math_utils import center_signals, compute_phase_locking_value
+from scipy.fft import ifft, rfft
+from scipy.signal import butter, sosfiltfilt, savgol_coeffs
+from pyeyesweb.utils.math_utils import center_signals, compute_phase_locking_value_from_analytic
 
 # ADDED THIS IMPORT:
 from pyeyesweb.utils.validators import validate_filter_params_tuple
@@ -58,58 +61,147 @@ def validate_and_normalize_filter_params(filter_params):
     return lowcut, highcut, fs
 
 
-def bandpass_filter(data, filter_params):
-    """Apply a band-pass filter if filter_params is set."""
-    if filter_params is None:
-        return data
+def design_bandpass_filter(filter_params, order=4):
+    """Design a Butterworth band-pass filter in second-order sections form.
+
+    Parameters
+    ----------
+    filter_params : tuple
+        Filter parameters as (lowcut, highcut, fs).
+    order : int, optional
+        Filter order (default: 4).
 
+    Returns
+    -------
+    ndarray
+        Second-order sections of shape (n_sections, 6), suitable for
+        `scipy.signal.sosfiltfilt`.
+    """
     lowcut, highcut, fs = validate_filter_params(*filter_params)
+    # The design is cached; hand out a copy so callers cannot alter the cache
+    return _butter_bandpass_sos(float(lowcut), float(highcut), float(fs), int(order)).copy()
+
+
+@lru_cache(maxsize=64)
+def _butter_bandpass_sos(lowcut, highcut, fs, order):
+    """Design a Butterworth band-pass filter once per parameter set."""
+    return butter(order, [lowcut, highcut], btype='band', fs=fs, output='sos')
+
+
+def bandpass_filter(data, filter_params, sos=None):
+    """Apply a zero-phase band-pass filter to every column of `data`.
 
-    nyquist = 0.5 * fs
-    low = lowcut / nyquist
-    high = highcut / nyquist
+    Parameters
+    ----------
+    data : ndarray
+        Signal array of shape (n_samples, n_channels).
+    filter_params : tuple or None
+        Filter parameters as (lowcut, highcut, fs). Ignored when `sos` is given.
+    sos : ndarray, optional
+        Precomputed second-order sections from `design_bandpass_filter`.
+        Passing them avoids redesigning the filter on every call.
+
+    Returns
+    -------
+    ndarray
+        Filtered signal, or `data` unchanged if no filter is configured.
+    """
+    if sos is None:
+        if filter_params is None:
+            return data
+        sos = design_bandpass_filter(filter_params)
 
-    b, a = butter(4, [low, high], btype='band')
+    return sosfiltfilt(sos, data, axis=0)
 
-    filtered_data = np.zeros_like(data)
-    for i in range(data.shape[1]):
-        filtered_data[:, i] = filtfilt(b, a, data[:, i])
 
-    return filtered_data
+def compute_analytic_signals(sig):
+    """Compute the analytic signals of the first two columns of `sig`.
+
+    Equivalent to `scipy.signal.hilbert`, but the forward transform of the
+    real input is a real FFT, which only computes the non-negative
+    frequencies the analytic signal keeps.
+    """
+    n = sig.shape[0]
+    # One batched transform over both columns instead of one call per column
+    spectrum = rfft(sig[:, :2], axis=0)
+    # Double the positive frequencies; DC and, for even lengths, Nyquist stay
+    spectrum[1:(n + 1) // 2] *= 2
+    # Zero-padding to n fills the negative frequencies with zeros
+    return ifft(spectrum, n=n, axis=0)
 
 
 def compute_hilbert_phases(sig):
     """Compute phase information from signals using Hilbert Transform."""
-    analytic_signal1 = hilbert(sig[:, 0])
-    analytic_signal2 = hilbert(sig[:, 1])
+    analytic_signal = compute_analytic_signals(sig)
 
-    phase1 = np.angle(analytic_signal1)
-    phase2 = np.angle(analytic_signal2)
+    phase1 = np.angle(analytic_signal[:, 0])
+    phase2 = np.angle(analytic_signal[:, 1])
 
     return phase1, phase2
 
 
-def compute_phase_synchronization(signals, filter_params=None):
+def compute_phase_synchronization(signals, filter_params=None, sos=None):
     """Compute phase synchronization between two signals."""
-    sig = bandpass_filter(signals, filter_params)
-    sig = center_signals(sig)
-    phase1, phase2 = compute_hilbert_phases(sig)
-
-    return compute_phase_locking_value(phase1, phase2)
+    # Filtering and the Hilbert transform both run along axis 0, so lay the
+    # channels out column-major. SciPy upcasts float32 windows to float64
+    # anyway, so this is the only copy made.
+    signals = np.asfortranarray(signals, dtype=np.float64)
+    sig = bandpass_filter(signals, filter_params, sos=sos)
+    if sig is signals:
+        sig = center_signals(sig)
+    else:
+        # The filter returned a fresh array, so it can be centered in place
+        sig -= sig.mean(axis=0, keepdims=True)
+    analytic_signal = compute_analytic_signals(sig)
+
+    return compute_phase_locking_value_from_analytic(analytic_signal[:, 0], analytic_signal[:, 1])
+
+
+@lru_cache(maxsize=None)
+def _savgol_operators(window_length, polyorder):
+    """Precompute the linear operators of a Savitzky-Golay filter.
+
+    Returns the interior convolution kernel and the matrices evaluating the
+    polynomial fitted to the first/last `window_length` samples at the edge
+    positions, which is what `scipy.signal.savgol_filter(mode='interp')` does.
+    """
+    half = window_length // 2
+    center = savgol_coeffs(window_length, polyorder, use='dot')
+    left = np.array([savgol_coeffs(window_length, polyorder, pos=i, use='dot')
+                     for i in range(half)])
+    right = np.array([savgol_coeffs(window_length, polyorder, pos=window_length - half + i, use='dot')
+                      for i in range(half)])
+    # np.convolve flips its kernel, so store it reversed
+    return center[::-1].copy(), left, right
 
 
 def apply_savgol_filter(signal, rate_hz=50.0):
-    """Apply Savitzky-Golay filter if enough data is available."""
-    if len(signal) < 5:
+    """Apply Savitzky-Golay filter if enough data is available.
+
+    Equivalent to `scipy.signal.savgol_filter(signal, window_length, 3)` with
+    the default `'interp'` edge handling, but the filter coefficients are
+    computed once per window length and reused across calls. For 2D input
+    each row is filtered independently.
+    """
+    N = np.shape(signal)[-1]
+    if N < 5:
         return np.array(signal)
 
-    N = len(signal)
     polyorder = 3
     window_length = min(N if N % 2 == 1 else N - 1, 11)
     if window_length <= polyorder:
         return np.array(signal)
 
-    try:
-        return savgol_filter(signal, window_length=window_length, polyorder=polyorder)
-    except Exception:
-        return np.array(signal)
\ No newline at end of file
+    signal = np.asarray(signal, dtype=np.float64)
+    kernel, left, right = _savgol_operators(window_length, polyorder)
+    half = window_length // 2
+
+    filtered = np.empty(signal.shape)
+    if signal.ndim == 1:
+        filtered[half:N - half] = np.convolve(signal, kernel, mode='valid')
+    else:
+        windows = np.lib.stride_tricks.sliding_window_view(signal, window_length, axis=-1)
+        filtered[..., half:N - half] = windows @ kernel[::-1]
+    filtered[..., :half] = signal[..., :window_length] @ left.T
+    filtered[..., N - half:] = signal[..., N - window_length:] @ right.T
+    return filtered
\ No newline at end of file
@@ -4,6 +4,9 @@ This module provides common validation functions used across multiple
 PyEyesWeb modules to ensure consistent error handling.
 """
 
+import numpy as np
+
+
 def validate_numeric(value, name, min_val=None, max_val=None):
     """Validate numeric parameter with optional bounds checking.
 
@@ -312,4 +315,42 @@ def validate_string(value, names: list[str]):
     if value not in names:
         raise ValueError(f"Invalid method: {value}. Must be one of {names}.")
     
-    return value
\ No newline at end of file
+    return value
+
+
+def validate_float_dtype(value, name='dtype'):
+    """Validate a floating-point computation precision.
+
+    Parameters
+    ----------
+    value : any
+        Value to validate, e.g. `np.float32`, `"float64"` or `np.dtype("f4")`.
+    name : str, optional
+        Parameter name for error messages.
+
+    Returns
+    -------
+    numpy.dtype
+        Either `float32` or `float64`.
+
+    Raises
+    ------
+    ValueError
+        If value is not a single- or double-precision float type.
+
+    Examples
+    --------
+    >>> validate_float_dtype("float32")
+    dtype('float32')
+    >>> validate_float_dtype(int)
+    ValueError: dtype must be float32 or float64, got int64
+    """
+    try:
+        dtype = np.dtype(value)
+    except TypeError:
+        raise ValueError(f"{name} must be float32 or float64, got {value!r}")
+
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"{name} must be float32 or float64, got {dtype}")
+
+    return dtype
@@ -4,6 +4,7 @@ import numpy as np
 from pyeyesweb.data_models import SlidingWindow
 from pyeyesweb.analysis_primitives import (
     Clusterability,
+    MultiScaleEntropyDominance,
     Rarity,
     StatisticalMoment,
     Synchronization,
@@ -109,3 +110,324 @@ def test_synchronization_api():
     # We just ensure it doesn't crash and returns the correct contract
     # (Actual PLV math is tested in your signal_processing unit tests)
     assert hasattr(result, "plv")
+
+
+def test_synchronization_with_bandpass_filter():
+    feature = Synchronization(filter_params=(1.0, 10.0, 100.0))
+    window = SlidingWindow(max_length=200, n_signals=2, n_dims=1)
+
+    t = np.arange(200) / 100.0
+    s1 = np.sin(2 * np.pi * 3 * t)
+    s2 = np.sin(2 * np.pi * 3 * t + 0.3)
+
+    for v1, v2 in zip(s1, s2):
+        window.append([[v1], [v2]])
+
+    result = feature(window)
+
+    assert result.is_valid is True
+    # Constant phase lag -> near perfect phase locking
+    assert result.plv > 0.95
+
+
+def test_clusterability_bruteforce_matches_kdtree():
+    from scipy.spatial import cKDTree
+    from pyeyesweb.analysis_primitives.clusterability import _hopkins_bruteforce
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(40, 3))
+    uniform_sample = rng.uniform(data.min(axis=0), data.max(axis=0), size=(5, 3))
+
+    sample_idx = np.array([0, 7, 13, 21, 39])
+    u, w = _hopkins_bruteforce(data, sample_idx, uniform_sample)
+
+    tree = cKDTree(data)
+    assert np.isclose(u, tree.query(data[sample_idx], k=2)[0][:, 1].sum())
+    assert np.isclose(w, tree.query(uniform_sample, k=1)[0].sum())
+
+
+def test_mse_sample_entropy_matches_reference():
+    mse = MultiScaleEntropyDominance(m=2, r=0.2)
+    x = np.random.default_rng(1).normal(size=300)
+
+    # Reference SampEn over explicit templates (ordered pairs, no self-matches)
+    u = (x - x.mean()) / x.std()
+    t_m = np.array([u[i:i + 2] for i in range(len(u) - 2)])
+    t_m1 = np.array([u[i:i + 3] for i in range(len(u) - 3)])
+    b = (np.max(np.abs(t_m[:, None] - t_m[None]), axis=2) < 0.2).sum() - len(t_m)
+    a = (np.max(np.abs(t_m1[:, None] - t_m1[None]), axis=2) < 0.2).sum() - len(t_m1)
+    expected = -np.log((a / (len(t_m1) * (len(t_m1) - 1))) / (b / (len(t_m) * (len(t_m) - 1))))
+
+    assert np.isclose(mse._sample_entropy(x), expected)
+
+
+def test_clusterability_reuses_tree_for_unchanged_window():
+    feature = Clusterability(n_neighbors=2)
+    data = np.random.default_rng(2).normal(size=(600, 1, 2))
+
+    first = feature.compute(data)
+    tree = feature._cached_tree
+    second = feature.compute(data)
+
+    assert first.is_valid and second.is_valid
+    assert feature._cached_tree is tree
+
+    feature.compute(data[1:])
+    assert feature._cached_tree is not tree
+
+
+def test_clusterability_column_bounds():
+    from pyeyesweb.analysis_primitives.clusterability import _column_bounds
+
+    data = np.random.default_rng(4).normal(size=(30, 4))
+    mins, maxs = _column_bounds(data)
+
+    np.testing.assert_array_equal(mins, data.min(axis=0))
+    np.testing.assert_array_equal(maxs, data.max(axis=0))
+
+
+def test_mse_dominance_streaming_matches_per_signal():
+    mse = MultiScaleEntropyDominance(max_scale=3, min_points=50, methods=["complexity_index", "dominance_score", "leader_identification"])
+    window = SlidingWindow(max_length=200, n_signals=3, n_dims=1)
+
+    rng = np.random.default_rng(5)
+    for sample in rng.normal(size=(200, 3)):
+        window.append(sample)
+
+    result = mse(window)
+
+    data, _ = window.to_flat_array()
+    expected = [mse._calculate_complexity_index(data[:, i]) for i in range(3)]
+    assert np.allclose(result["complexity_index"], expected)
+    assert len(result["dominance_score"]) == 3
+    assert result["leader_complexity"] == (int(np.argmin(expected)), min(expected))
+
+
+def test_mse_dominance_multi_signal_exits_in_fresh_interpreter():
+    """The multi-signal path must not leave the JIT threading layer hung at exit."""
+    import subprocess
+    import sys
+    import textwrap
+
+    script = textwrap.dedent("""
+        import numpy as np
+        from pyeyesweb.data_models import SlidingWindow
+        from pyeyesweb.analysis_primitives import MultiScaleEntropyDominance
+
+        window = SlidingWindow(max_length=200, n_signals=3, n_dims=1)
+        for sample in np.random.default_rng(0).normal(size=(200, 3)):
+            window.append(sample)
+        result = MultiScaleEntropyDominance(max_scale=3, min_points=50)(window)
+        assert len(result["complexity_index"]) == 3
+    """)
+    completed = subprocess.run([sys.executable, "-c", script], timeout=120, capture_output=True)
+    assert completed.returncode == 0, completed.stderr.decode()
+
+
+def test_mse_complexity_index_is_trapezoid_over_scales():
+    mse = MultiScaleEntropyDominance(max_scale=4, min_points=50)
+    x = np.random.default_rng(6).normal(size=400)
+
+    sampen = [mse._sample_entropy(x[:len(x) // scale * scale].reshape(-1, scale).mean(axis=1))
+              for scale in range(1, 5)]
+    expected = 0.5 * sampen[0] + sampen[1] + sampen[2] + 0.5 * sampen[3]
+
+    assert np.isclose(mse._calculate_complexity_index(x), expected)
+
+
+def test_clusterability_compute_batch_matches_compute():
+    rng = np.random.default_rng(7)
+    windows = [rng.normal(size=(60, 1, 2)), rng.normal(size=(3, 1, 2)), rng.normal(5.0, 0.1, size=(80, 1, 2))]
+
+    batch = Clusterability(n_neighbors=2, seed=11).compute_batch(windows)
+    feature = Clusterability(n_neighbors=2, seed=11)
+    single = [feature.compute(window) for window in windows]
+
+    assert batch[1].is_valid is False
+    for b, s in zip(batch, single):
+        assert b.is_valid == s.is_valid
+        if s.is_valid:
+            assert np.isclose(b.clusterability, s.clusterability)
+
+
+def test_clusterability_seed_is_reproducible():
+    data = np.random.default_rng(8).normal(size=(50, 1, 3))
+
+    first = Clusterability(n_neighbors=2, seed=3).compute(data)
+    second = Clusterability(n_neighbors=2, seed=3).compute(data)
+
+    assert first.clusterability == second.clusterability
+
+
+def test_mse_unrolled_m2_kernel_matches_generic():
+    from pyeyesweb.analysis_primitives.mse_dominance import _sampen_kernel, _sampen_kernel_m2
+
+    u = np.random.default_rng(9).normal(size=400).astype(np.float32)
+    r = np.float32(0.2)
+
+    assert _sampen_kernel_m2(u, r) == _sampen_kernel(u, 2, r)
+
+
+def test_mse_prefix_sum_coarse_graining_matches_block_means():
+    x = np.random.default_rng(10).normal(size=203)
+
+    series = MultiScaleEntropyDominance(max_scale=5, min_points=20)._coarse_grained_series(x)
+    assert len(series) == 5
+    for scale, coarse in enumerate(series, start=1):
+        end = (len(x) // scale) * scale
+        np.testing.assert_allclose(coarse, x[:end].reshape(-1, scale).mean(axis=1))
+
+    # Scales with fewer than min_points coarse points are dropped
+    assert len(MultiScaleEntropyDominance(max_scale=5, min_points=45)._coarse_grained_series(x)) == 4
+
+
+def test_mse_tiled_match_count_matches_dense():
+    from numpy.lib.stride_tricks import sliding_window_view
+    from pyeyesweb.analysis_primitives.mse_dominance import _count_matches_tiled
+
+    u = np.random.default_rng(12).normal(size=150)
+
+    def dense(templates):
+        return (np.abs(templates[:, None] - templates[None]).max(axis=2) < 0.3).sum() - len(templates)
+
+    b = dense(sliding_window_view(u, 2)[:-1])
+    a = dense(sliding_window_view(u, 3)[:-1])
+
+    assert _count_matches_tiled(sliding_window_view(u, 3), 0.3, tile=32) == (a, b)
+
+
+def test_statistical_moment_matches_scipy():
+    from scipy import stats
+
+    metrics = ["mean", "std_dev", "skewness", "kurtosis"]
+    data = np.random.default_rng(13).gamma(2.0, size=(40, 2, 2))
+    flat = data.reshape(40, -1)
+
+    for dtype, rtol in ((np.float64, 1e-7), (np.float32, 1e-4)):
+        result = StatisticalMoment(metrics=metrics, dtype=dtype).compute(data)
+
+        np.testing.assert_allclose(result.mean, flat.mean(axis=0), rtol=rtol)
+        np.testing.assert_allclose(result.std_dev, flat.std(axis=0, ddof=1), rtol=rtol)
+        np.testing.assert_allclose(result.skewness, stats.skew(flat, axis=0), rtol=rtol)
+        np.testing.assert_allclose(result.kurtosis, stats.kurtosis(flat, axis=0), rtol=rtol)
+
+    with pytest.raises(ValueError):
+        StatisticalMoment(dtype=np.int64)
+
+
+def test_rarity_matches_histogram_reference():
+    feature = Rarity(alpha=0.5)
+    samples = np.random.default_rng(14).normal(size=(50, 1, 1))
+
+    n_bins = int(np.sqrt(50))
+    counts, edges = np.histogram(samples.ravel(), bins=n_bins)
+    probabilities = counts / 50
+    top = np.argmax(probabilities)
+    last = np.clip(np.searchsorted(edges, samples.ravel()[-1], side="right") - 1, 0, n_bins - 1)
+    expected = abs(top - last) * (probabilities[top] - probabilities[last]) * 0.5
+
+    assert np.isclose(feature.compute(samples).rarity, expected)
+    assert feature.compute(np.full((10, 1, 1), 3.0)).rarity == 0.0
+
+
+def test_mse_sample_entropy_cache():
+    mse = MultiScaleEntropyDominance(m=2, r=0.2)
+    x = np.random.default_rng(17).normal(size=200)
+
+    first = mse._sample_entropy(x)
+    assert len(mse._sampen_cache) == 1
+    assert mse._sample_entropy(x.copy()) == first
+    assert len(mse._sampen_cache) == 1
+
+    # Changing a matching parameter must not reuse the cached value
+    mse.r = 0.3
+    updated = mse._sample_entropy(x)
+    assert updated != first
+    assert updated == MultiScaleEntropyDominance(m=2, r=0.3)._sample_entropy(x)
+    assert len(mse._sampen_cache) == 2
+
+
+def test_mse_batch_kernel_matches_per_series():
+    from pyeyesweb.analysis_primitives.mse_dominance import _sampen_kernel, _sampen_kernel_batch
+
+    rng = np.random.default_rng(19)
+    series = [rng.normal(size=n) for n in (120, 60, 40)]
+    lengths = np.array([len(u) for u in series], dtype=np.int64)
+    stack = np.zeros((3, 120))
+    for row, u in enumerate(series):
+        stack[row, :len(u)] = u
+
+    for m in (2, 3):
+        A, B = _sampen_kernel_batch(stack, lengths, m, 0.3)
+        for row, u in enumerate(series):
+            assert (A[row], B[row]) == _sampen_kernel(u, m, 0.3)
+
+
+def test_rarity_streaming_matches_compute():
+    feature = Rarity(alpha=0.7)
+    window = SlidingWindow(max_length=50, n_signals=2, n_dims=1)
+    rng = np.random.default_rng(23)
+
+    for step in range(300):
+        sample = rng.normal(size=2)
+        if step % 37 == 0:
+            sample *= 5.0  # occasional outliers move the window range
+        window.append(sample)
+        if step == 150:
+            window.reset()
+            continue
+        if step % 3 == 0:
+            continue  # several samples may arrive between two calls
+
+        tensor, _ = window.to_tensor()
+        assert feature(window).rarity == feature.compute(tensor).rarity
+
+    assert feature._window is window
+
+
+
+def test_analytic_signals_match_scipy_hilbert():
+    from scipy.signal import hilbert
+    from pyeyesweb.utils.signal_processing import compute_analytic_signals
+
+    rng = np.random.default_rng(29)
+    for n in (64, 65):
+        sig = rng.normal(size=(n, 3))
+        np.testing.assert_allclose(compute_analytic_signals(sig), hilbert(sig[:, :2], axis=0), atol=1e-12)
+
+
+def test_mse_dominance_out_clears_leader_when_not_ready():
+    mse = MultiScaleEntropyDominance(max_scale=2, min_points=50, methods=["complexity_index", "leader_identification"])
+    window = SlidingWindow(max_length=120, n_signals=2, n_dims=1)
+    for sample in np.random.default_rng(32).normal(size=(120, 2)):
+        window.append(sample)
+
+    out = {}
+    mse(window, out=out)
+    assert isinstance(out["leader_complexity"], tuple)
+
+    window.reset()
+    mse(window, out=out)
+    assert np.isnan(out["complexity_index"]).all()
+    assert np.isnan(out["leader_complexity"])
+    assert "leader_identification" not in out
+
+
+def test_mse_dominance_out_reuses_arrays():
+    mse = MultiScaleEntropyDominance(max_scale=2, min_points=50, methods=["complexity_index", "dominance_score"])
+    window = SlidingWindow(max_length=120, n_signals=2, n_dims=1)
+    rng = np.random.default_rng(31)
+    for sample in rng.normal(size=(120, 2)):
+        window.append(sample)
+
+    out = {}
+    assert mse(window, out=out) is out
+    ci = out["complexity_index"]
+    assert isinstance(ci, np.ndarray) and ci.shape == (2,)
+
+    expected = mse(window)
+    window.append(rng.normal(size=2))
+    mse(window, out=out)
+    assert out["complexity_index"] is ci
+    np.testing.assert_allclose(ci, mse(window)["complexity_index"])
+    assert not np.allclose(ci, expected["complexity_index"])
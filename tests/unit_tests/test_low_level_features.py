@@ -262,3 +262,249 @@ def test_kinetic_energy_flattening():
     assert flat_dict["ke_joint_LeftHand_total"] == 16.0
     assert flat_dict["ke_joint_LeftHand_x"] == 16.0
     assert flat_dict["ke_joint_RightHand_y"] == 9.0
+
+
+def test_jerk_rms_matches_gradient_reference():
+    from pyeyesweb.utils.math_utils import compute_jerk_rms
+
+    np.random.seed(0)
+    signal = np.random.rand(40)
+
+    expected = signal
+    for _ in range(2):
+        expected = np.gradient(expected, 1.0 / 50.0)
+
+    assert np.isclose(compute_jerk_rms(signal, 50.0), np.sqrt(np.mean(expected**2)))
+
+
+def test_sparc_compiled_path_matches_numpy(monkeypatch):
+    from pyeyesweb.utils import math_utils
+
+    rng = np.random.default_rng(6)
+    t = np.linspace(0, 2, 120)
+    signals = [np.abs(np.sin(2 * np.pi * t)) + 0.01 * rng.random(120), rng.random(300), np.exp(-t)]
+    compiled = [math_utils.compute_sparc(signal, rate_hz=60.0) for signal in signals]
+
+    monkeypatch.setattr(math_utils, "NUMBA_AVAILABLE", False)
+    for signal, value in zip(signals, compiled):
+        assert np.isclose(value, math_utils.compute_sparc(signal, rate_hz=60.0))
+
+
+def test_sparc_constant_check_matches_isclose():
+    from pyeyesweb.utils.math_utils import _is_constant
+
+    signals = np.array([
+        [1.0, 1.0, 1.0],
+        [1.0, 1.0 + 1e-9, 1.0 - 1e-9],
+        [1.0, 1.0, 1.1],
+        [0.0, 0.0, 1e-7],
+        [5.0, 5.0, np.nan],
+    ])
+    expected = np.all(np.isclose(signals, signals[:, :1]), axis=1)
+    np.testing.assert_array_equal(_is_constant(signals), expected)
+
+
+def test_savgol_filter_matches_scipy():
+    from scipy.signal import savgol_filter
+    from pyeyesweb.utils.signal_processing import apply_savgol_filter
+
+    np.random.seed(0)
+    for n in (7, 12, 50):
+        signal = np.random.rand(n)
+        window_length = min(n if n % 2 == 1 else n - 1, 11)
+        expected = savgol_filter(signal, window_length=window_length, polyorder=3)
+        np.testing.assert_allclose(apply_savgol_filter(signal), expected, atol=1e-10)
+
+
+def test_smoothness_compute_batch_matches_compute():
+    feature = Smoothness(rate_hz=50.0)
+
+    np.random.seed(0)
+    t = np.linspace(0, 1, 50)
+    signals = np.vstack([np.sin(2 * np.pi * t), np.random.rand(50), np.abs(np.cos(3 * t))])
+
+    batch = feature.compute_batch(signals)
+
+    assert len(batch) == 3
+    for row, result in zip(signals, batch):
+        single = feature.compute(row)
+        assert result.is_valid is True
+        assert np.isclose(result.sparc, single.sparc)
+        assert np.isclose(result.jerk_rms, single.jerk_rms)
+
+
+def test_smoothness_compute_from_positions():
+    feature = Smoothness(rate_hz=50.0)
+    window = SlidingWindow(max_length=50, n_signals=1, n_dims=2)
+
+    t = np.linspace(0, 1, 50)
+    for ti, xi, yi in zip(t, np.cos(2 * np.pi * t), np.sin(2 * np.pi * t)):
+        window.append([xi, yi], timestamp=ti)
+
+    positions, timestamps = window.to_flat_array()
+    result = feature.compute_from_positions(positions, timestamps)
+
+    speed = np.linalg.norm(np.gradient(positions.astype(np.float64), timestamps, axis=0), axis=1)
+    expected = feature.compute(speed)
+    assert result.is_valid is True
+    assert np.isclose(result.sparc, expected.sparc)
+    assert np.isclose(result.jerk_rms, expected.jerk_rms)
+
+
+def test_geometric_symmetry_multiple_pairs_match_reference():
+    pairs = [(0, 1), (2, 3), (4, 1)]
+    feature = GeometricSymmetry(joint_pairs=pairs)
+    frame = np.random.default_rng(3).normal(size=(5, 3))
+
+    result = feature.compute(frame)
+
+    centered = frame - frame.mean(axis=0)
+    for left, right in pairs:
+        reflected = centered[right] * np.array([-1.0, 1.0, 1.0])
+        error = np.linalg.norm(centered[left] - reflected)
+        error /= np.linalg.norm(centered[left]) + np.linalg.norm(centered[right]) + GeometricSymmetry.EPSILON
+        assert np.isclose(result.pairs[f"{left}_{right}"], max(0.0, 1.0 - error))
+
+
+def test_contraction_expansion_compute_batch_matches_compute():
+    frames = np.random.default_rng(37).normal(size=(6, 8, 3))
+    frames[2] = frames[2, :1]  # every point coincides: degenerate frame
+
+    for feature, field in (
+        (BoundingBoxFilledArea(), "contraction_index"),
+        (EllipsoidSphericity(), "sphericity"),
+        (PointsDensity(), "points_density"),
+    ):
+        batch = feature.compute_batch(frames)
+        assert len(batch) == len(frames)
+        for frame, result in zip(frames, batch):
+            assert np.isclose(getattr(result, field), getattr(feature.compute(frame), field))
+
+
+def test_bounding_box_corners_match_product_order():
+    import itertools
+
+    points = np.random.default_rng(41).normal(size=(12, 3))
+    area, corners = BoundingBoxFilledArea._get_aabb_data(points)
+
+    mins, maxs = points.min(axis=0), points.max(axis=0)
+    expected = np.array(list(itertools.product(*zip(mins, maxs))))
+    dims = maxs - mins
+    np.testing.assert_allclose(corners, expected)
+    assert np.isclose(area, 2 * (dims[0] * dims[1] + dims[0] * dims[2] + dims[1] * dims[2]))
+
+
+def test_direction_change_kernels_match_numpy():
+    from pyeyesweb.low_level.direction_change import (
+        _cosine_gate, _cosine_kernel, _polygon_area_kernel, _subsample_indices
+    )
+
+    rng = np.random.default_rng(43)
+    for n_dims in (2, 3):
+        pos = rng.normal(size=(30, n_dims))
+
+        # Reference cosine score from the start, mid and end points
+        l0, l1 = pos[-1] - pos[15], pos[15] - pos[0]
+        theta = np.arccos(np.clip(l0 @ l1 / (np.linalg.norm(l0) * np.linalg.norm(l1)), -1.0, 1.0))
+        diff = abs(1.0 - theta / np.pi - 0.5)
+        expected_cosine = 1.0 - diff / 0.5 if diff < 0.5 else 0.0
+        assert np.isclose(_cosine_kernel(pos, 0.5, _cosine_gate(0.5)), expected_cosine)
+
+        indices = _subsample_indices(30, 20)
+        subset = pos[indices]
+        closed = np.vstack([subset, subset[:1]])
+        if n_dims == 2:
+            expected_area = abs(np.sum(closed[:-1, 0] * closed[1:, 1] - closed[:-1, 1] * closed[1:, 0])) / 2
+        else:
+            expected_area = np.linalg.norm(np.cross(closed[:-1], closed[1:]).sum(axis=0)) / 2
+        assert np.isclose(_polygon_area_kernel(pos, indices), expected_area)
+
+
+def test_kinetic_energy_without_joint_details():
+    frame = np.array([[4.0, 0.0, 0.0], [0.0, 3.0, 0.0]])
+    detailed = KineticEnergy(weights=2.0).compute(frame)
+    summary = KineticEnergy(weights=2.0, joint_details=False).compute(frame)
+
+    assert summary.joints is None
+    assert summary.total_energy == detailed.total_energy
+    assert summary.component_energy == detailed.component_energy
+    assert "joint_0_total" not in summary.to_flat_dict()
+
+
+def test_float32_frames_stay_single_precision():
+    frame = np.random.default_rng(0).random((17, 3)).astype(np.float32)
+
+    velocities = KineticEnergy(weights=2.0)
+    energy = velocities.compute(frame)
+    reference = velocities.compute(frame.astype(np.float64))
+    assert np.isclose(energy.total_energy, reference.total_energy, rtol=1e-5)
+
+    radii = EllipsoidSphericity._fit_ellipsoid_pca(frame)
+    assert radii.dtype == np.float32
+    _, corners = BoundingBoxFilledArea._get_aabb_data(frame)
+    assert corners.dtype == np.float32
+
+
+def test_ellipsoid_radii_match_with_and_without_axes():
+    frame = np.random.default_rng(1).normal(size=(17, 3)) * [3.0, 2.0, 1.0]
+
+    radii = EllipsoidSphericity._fit_ellipsoid_pca(frame)
+    radii_with_axes, axes = EllipsoidSphericity._fit_ellipsoid_pca(frame, return_axes=True)
+
+    np.testing.assert_allclose(radii, radii_with_axes)
+    assert axes.shape == (3, 3)
+    scatter = np.cov(frame, rowvar=False)
+    np.testing.assert_allclose(scatter @ axes[:, 0], radii[0] ** 2 * axes[:, 0], atol=1e-10)
+
+
+def test_aabb_rejects_2d_points():
+    """2D points must not reach the 3D-only AABB kernels."""
+    points = np.random.default_rng(0).normal(size=(6, 2))
+    with pytest.raises(IndexError):
+        BoundingBoxFilledArea._get_aabb_area(points)
+    with pytest.raises(IndexError):
+        BoundingBoxFilledArea._get_aabb_data(points)
+
+
+def test_small_hull_kernel_matches_qhull():
+    import itertools
+    from scipy.spatial import ConvexHull
+    from pyeyesweb.low_level.contraction_expansion import _small_hull_kernel, _spans_volume
+
+    rng = np.random.default_rng(4)
+    cube = np.array(list(itertools.product((0.0, 1.0), repeat=3)))
+    face_centers = np.array([[0.5, 0.5, 0.0], [0.5, 0.5, 1.0], [0.0, 0.5, 0.5], [0.5, 0.5, 0.5]])
+    clouds = [rng.normal(size=(n, 3)) for n in (4, 8, 17, 25)]
+    clouds += [cube, np.vstack([cube, face_centers, cube[:2]])]
+
+    for points in clouds:
+        area, is_vertex = _small_hull_kernel(points)
+        hull = ConvexHull(points)
+        assert np.isclose(area, hull.area)
+        assert is_vertex.sum() == len(hull.vertices)
+
+    flat = rng.normal(size=(10, 3))
+    flat[:, 2] = 0.0
+    assert _small_hull_kernel(flat)[0] == 0.0
+
+    # Near-planar clouds are beyond the kernel's tolerances and must go to Qhull
+    tilt = np.linalg.qr(rng.normal(size=(3, 3)))[0]
+    for thickness in (1e-5, 1e-7, 1e-9):
+        thin = rng.normal(size=(12, 3))
+        thin[:, 2] *= thickness
+        thin = thin @ tilt
+        assert not _spans_volume(thin)
+        assert np.isclose(BoundingBoxFilledArea._get_hull_area(thin), ConvexHull(thin).area)
+
+
+def test_direction_change_cosine_gate_matches_angle_test():
+    from pyeyesweb.low_level.direction_change import _cosine_gate
+
+    angles = np.linspace(0.0, np.pi, 181)
+    for epsilon in (0.05, 0.2, 0.5, 0.8):
+        gate = _cosine_gate(epsilon)
+        for theta in angles:
+            accepted = abs(0.5 - theta / np.pi) < epsilon
+            # Skip angles within rounding of the boundary
+            if not np.isclose(abs(0.5 - theta / np.pi), epsilon):
+                assert (abs(np.cos(theta)) < gate) == accepted
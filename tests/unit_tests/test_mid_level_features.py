@@ -140,3 +140,61 @@ def test_lightness_valid_kinematics():
     assert result.is_valid is True
     assert 0.0 <= result.latest_weight_index <= 1.0
     assert isinstance(result.lightness, float)
+
+
+def test_lightness_streaming_matches_compute():
+    """Streaming reuses per-frame weight indices but must agree with compute."""
+    from pyeyesweb.data_models.sliding_window import SlidingWindow
+
+    streaming = Lightness(alpha=0.5)
+    reference = Lightness(alpha=0.5)
+    window = SlidingWindow(max_length=15, n_signals=2, n_dims=3)
+    rng = np.random.default_rng(7)
+
+    for step in range(40):
+        window.append(rng.random(6))
+        if step == 25:
+            window.max_length = 10
+        if step == 32:
+            window.reset()
+        result = streaming(window)
+        expected = reference.compute(window.to_tensor()[0])
+
+        assert result.is_valid == expected.is_valid
+        if expected.is_valid:
+            assert np.isclose(result.lightness, expected.lightness)
+            assert np.isclose(result.latest_weight_index, expected.latest_weight_index)
+
+
+def test_suddenness_interp2d_grid_lookup():
+    """Grid points return the table entries; values outside the grid return -1."""
+    feature = Suddenness()
+    tab = feature._alpha_tab
+
+    assert np.isclose(feature._interp2d(tab, feature._a_vals[3], feature._b_vals[2]), tab[2, 3])
+    assert np.isclose(feature._interp2d(tab, feature._a_vals[-1], feature._b_vals[-1]), tab[-1, -1])
+    midpoint = feature._interp2d(tab, (feature._a_vals[0] + feature._a_vals[1]) / 2, 0.0)
+    assert np.isclose(midpoint, (tab[0, 0] + tab[0, 1]) / 2)
+    assert feature._interp2d(tab, 1.0, 0.5) == -1.0
+    assert feature._interp2d(tab, 5.0, np.nan) == -1.0
+
+
+def test_suddenness_midpoint_percentiles_match_numpy():
+    from pyeyesweb.mid_level.suddenness import _midpoint_percentiles
+
+    rng = np.random.default_rng(2)
+    for n in (5, 6, 17, 100):
+        data = rng.random(n)
+        expected = np.percentile(data, [95, 75, 50, 25, 5], method='midpoint')
+        np.testing.assert_array_equal(_midpoint_percentiles(data), expected)
+
+        # SlidingWindow data is float32: still float64 out, within float32 rounding
+        data32 = data.astype(np.float32)
+        result = _midpoint_percentiles(data32)
+        assert result.dtype == np.float64
+        np.testing.assert_allclose(result, np.percentile(data32, [95, 75, 50, 25, 5], method='midpoint'),
+                                   rtol=np.finfo(np.float32).eps)
+
+    data = rng.random(20)
+    data[4] = np.nan
+    assert np.all(np.isnan(_midpoint_percentiles(data)))
@@ -123,7 +123,7 @@ def test_dynamic_resize_expand():
 
 
 def test_reset():
-    """Test that reset clears the buffer and restores NaNs."""
+    """Test that reset clears the window and, in debug mode, restores NaNs."""
     window = SlidingWindow(max_length=5, n_signals=1, n_dims=1)
     window.append(10.0)
     window.append(20.0)
@@ -133,7 +133,207 @@ def test_reset():
 
     assert len(window) == 0
     assert window.is_full is False
+    tensor, timestamps = window.to_tensor()
+    assert tensor.shape == (0, 1, 1)
+    assert timestamps.shape == (0,)
+
+    window.append(30.0, timestamp=1.0)
+    tensor, timestamps = window.to_tensor()
+    np.testing.assert_array_equal(tensor.ravel(), [30.0])
+    np.testing.assert_array_equal(timestamps, [1.0])
 
-    # Check internal buffer is filled with NaNs again
+    # Debug mode also fills the internal buffers with NaNs
+    window.reset(debug=True)
     assert np.isnan(window._buffer).all()
-    assert np.isnan(window._timestamp).all()
\ No newline at end of file
+    assert np.isnan(window._timestamp).all()
+
+def test_wraparound_order_after_many_appends():
+    """Test chronological order is preserved across repeated buffer wraps."""
+    window = SlidingWindow(max_length=4, n_signals=1, n_dims=2)
+    for i in range(11):
+        window.append([i, -i], timestamp=float(i))
+
+    tensor, timestamps = window.to_tensor()
+
+    np.testing.assert_array_equal(tensor[:, 0, 0], [7, 8, 9, 10])
+    np.testing.assert_array_equal(tensor[:, 0, 1], [-7, -8, -9, -10])
+    np.testing.assert_array_equal(timestamps, [7.0, 8.0, 9.0, 10.0])
+    assert tensor.flags["C_CONTIGUOUS"]
+
+
+def test_single_producer_single_consumer():
+    """Test that a lock-free consumer always reads a consistent window while a producer appends."""
+    import threading
+
+    window = SlidingWindow(max_length=16, n_signals=1, n_dims=1)
+    n_samples = 5000
+
+    def produce():
+        for i in range(n_samples):
+            window.append(float(i), timestamp=float(i))
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    while producer.is_alive():
+        tensor, timestamps = window.to_tensor()
+        assert len(tensor) == len(timestamps) <= 16
+        assert not np.isnan(timestamps).any()
+        # Chronological, and every sample still paired with its timestamp
+        assert np.all(np.diff(timestamps) == 1.0)
+        np.testing.assert_array_equal(tensor.ravel(), timestamps)
+    producer.join()
+
+    _, timestamps = window.to_tensor()
+    np.testing.assert_array_equal(timestamps, np.arange(n_samples - 16, n_samples, dtype=float))
+
+
+def test_reset_and_resize_on_producer_keep_readers_consistent():
+    """Test that readers stay consistent while the producer resets and resizes the window."""
+    import threading
+
+    window = SlidingWindow(max_length=32, n_signals=1, n_dims=1)
+
+    def produce():
+        for i in range(5000):
+            window.append(float(i), timestamp=float(i))
+            if i % 97 == 0:
+                window.reset()
+            if i % 251 == 0:
+                window.max_length = 16 if window.max_length == 32 else 32
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    while producer.is_alive():
+        tensor, timestamps = window.to_tensor()
+        assert np.all(np.diff(timestamps) == 1.0)
+        np.testing.assert_array_equal(tensor.ravel(), timestamps)
+    producer.join()
+
+    window.reset()
+    for value in range(100, 150):
+        window.append(float(value), timestamp=float(value))
+    tensor, _ = window.to_tensor()
+    np.testing.assert_array_equal(tensor.ravel(), np.arange(150 - window.max_length, 150))
+
+
+def test_rejected_append_leaves_window_intact():
+    """Test that a sample or timestamp that cannot be stored changes nothing."""
+    window = SlidingWindow(max_length=3, n_signals=1, n_dims=3)
+    for i in range(4):
+        window.append([i, i, i], timestamp=float(i))
+    before, before_times = window.to_tensor()
+
+    with pytest.raises(ValueError):
+        window.append(["a", "b", "c"])
+    with pytest.raises(ValueError):
+        window.append([9.0, "x", 9.0])
+    with pytest.raises(ValueError):
+        window.append([9.0, 9.0, 9.0], timestamp="x")
+    with pytest.raises(ValueError):
+        window.append([1.0, 2.0])
+
+    tensor, timestamps = window.to_tensor()
+    np.testing.assert_array_equal(tensor, before)
+    np.testing.assert_array_equal(timestamps, before_times)
+    np.testing.assert_array_equal(window._snapshot()[0], before)
+    np.testing.assert_array_equal(window._latest_frame(), before[-1])
+    assert window.appended_since()[2] == (0, 4)
+
+
+def test_append_fast_paths_match_array_path():
+    """Scalars, flat lists and nested lists store the same values as arrays."""
+    win_fast = SlidingWindow(max_length=4, n_signals=2, n_dims=1)
+    win_ref = SlidingWindow(max_length=4, n_signals=2, n_dims=1)
+    win_fast.append([1.0, 2.0], timestamp=0.0)
+    win_fast.append((3, 4), timestamp=1.0)
+    win_fast.append([[5.0], [6.0]], timestamp=2.0)
+    for t, row in enumerate([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]):
+        win_ref.append(np.array(row).reshape(2, 1), timestamp=float(t))
+    np.testing.assert_array_equal(win_fast.to_tensor()[0], win_ref.to_tensor()[0])
+
+    win_scalar = SlidingWindow(max_length=2, n_signals=1, n_dims=1)
+    for value in (1, 2.5, 3.0):
+        win_scalar.append(value)
+    np.testing.assert_array_equal(win_scalar.to_tensor()[0].ravel(), [2.5, 3.0])
+
+
+def test_to_flat_array_fortran_order():
+    """Column-major export holds the same values with contiguous columns."""
+    window = SlidingWindow(max_length=3, n_signals=2, n_dims=2)
+    for i in range(5):
+        window.append(np.arange(4) + 10 * i)
+
+    flat_c, _ = window.to_flat_array()
+    flat_f, _ = window.to_flat_array(order="F")
+
+    np.testing.assert_array_equal(flat_f, flat_c)
+    assert flat_f.flags["F_CONTIGUOUS"]
+    assert flat_f[:, 1].flags["C_CONTIGUOUS"]
+
+    with pytest.raises(ValueError):
+        window.to_flat_array(order="K")
+
+
+def test_appended_since():
+    """Test that only samples newer than a version are returned."""
+    window = SlidingWindow(max_length=4, n_signals=1, n_dims=1)
+    window.append(1.0)
+    samples, _, version = window.appended_since()
+    np.testing.assert_array_equal(samples.ravel(), [1.0])
+
+    window.append(2.0)
+    window.append(3.0)
+    samples, _, version = window.appended_since(version)
+    np.testing.assert_array_equal(samples.ravel(), [2.0, 3.0])
+
+    for value in range(5):
+        window.append(float(value))
+    assert window.appended_since(version)[0] is None
+
+    _, _, version = window.appended_since()
+    window.reset()
+    assert window.appended_since(version)[0] is None
+
+
+def test_snapshot_is_shared_until_next_append():
+    """Test that readers share one read-only snapshot per window state."""
+    window = SlidingWindow(max_length=3, n_signals=1, n_dims=2)
+    window.append([1.0, 2.0], timestamp=0.0)
+
+    tensor, _ = window._snapshot()
+    assert window._snapshot()[0] is tensor
+    assert not tensor.flags.writeable
+
+    window.append([3.0, 4.0], timestamp=1.0)
+    updated, _ = window._snapshot()
+    assert updated is not tensor
+    np.testing.assert_array_equal(updated, window.to_tensor()[0])
+    np.testing.assert_array_equal(window._latest_frame(), [[3.0, 4.0]])
+
+
+def test_dynamic_features_share_read_only_snapshot():
+    """Test that dynamic features on the same window state get one read-only tensor."""
+    from pyeyesweb.data_models import DynamicFeature, FeatureResult
+
+    class Recorder(DynamicFeature):
+        def __init__(self):
+            self.seen = None
+
+        def compute(self, data):
+            self.seen = data
+            return FeatureResult()
+
+    window = SlidingWindow(max_length=4, n_signals=1, n_dims=1)
+    window.append(1.0)
+    first, second = Recorder(), Recorder()
+    first(window)
+    second(window)
+
+    assert first.seen is second.seen
+    assert not first.seen.flags.writeable
+    with pytest.raises(ValueError):
+        first.seen[0, 0, 0] = 0.0
+
+    window.append(2.0)
+    first(window)
+    assert first.seen is not second.seen